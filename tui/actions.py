@@ -7,13 +7,16 @@ import os
 import time
 import curses
 import socket
+import select
 import subprocess
 import shlex
 from pathlib import Path
 import re
 from datetime import datetime
-import platform
+import sys
 import shutil
+from functools import lru_cache
+from collections import Counter
 
 from .view import select_loop, draw_silo_hud
 from .widgets import success_dialog, error_dialog, confirm_action
@@ -24,14 +27,46 @@ from .layout import safe_addnstr_inner, draw_centered_inner
 # ---------- Utilities ----------
 CONFIG = Path("/boot/firmware/config.txt")
 KEY = "display_hdmi_rotate"  # values: 0=0°, 1=90°, 2=180°, 3=270°
+_ROT_RE = re.compile(rf"^\s*{re.escape(KEY)}\s*=\s*([0-3])\s*(?:#.*)?$")
 
 def _sudo_run(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
     """Run command with sudo in a login shell, capture output."""
     return subprocess.run(["sudo", "bash", "-lc", cmd], check=check, text=True, capture_output=True)
 
+_WHICH_HITS: dict[str, str] = {}
+
+def _which(name: str) -> str | None:
+    """PATH lookup. Hits are cached for the process lifetime; misses are re-checked
+    on every call so a tool installed while the TUI runs is picked up."""
+    path = _WHICH_HITS.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _WHICH_HITS[name] = path
+    return path
+
 # ---------- OS detection / UX helpers ----------
-IS_MACOS = (platform.system() == "Darwin")
-IS_LINUX  = (platform.system() == "Linux")
+IS_MACOS = (sys.platform == "darwin")
+IS_LINUX  = sys.platform.startswith("linux")
+
+# Tool presence bits, resolved once at import (see _rescan_tools to refresh)
+HAVE_BLUETOOTHCTL = _which("bluetoothctl") is not None
+HAVE_NMCLI        = _which("nmcli") is not None
+HAVE_WPA_CLI      = _which("wpa_cli") is not None
+HAVE_BASH         = _which("bash") is not None
+
+def _rescan_tools() -> None:
+    """Drop cached PATH lookups and recompute HAVE_* (e.g. after installing a package)."""
+    global HAVE_BLUETOOTHCTL, HAVE_NMCLI, HAVE_WPA_CLI, HAVE_BASH
+    _WHICH_HITS.clear()
+    HAVE_BLUETOOTHCTL = _which("bluetoothctl") is not None
+    HAVE_NMCLI        = _which("nmcli") is not None
+    HAVE_WPA_CLI      = _which("wpa_cli") is not None
+    HAVE_BASH         = _which("bash") is not None
+
+def _have(flag: bool, name: str) -> bool:
+    """A HAVE_* flag, re-checking PATH when it says missing (no stale negatives)."""
+    return flag or _which(name) is not None
 
 # ---------- Cross-platform UX helpers (standardized macOS messaging) ----------
 def launch_app(
@@ -45,6 +80,7 @@ def launch_app(
     apt_pkg: str | None | bool = None,
     brew_pkg: str | None | bool = None,
     brew_cask: bool = False,
+    record_id: str | None = None,   # "Last Used" id, persisted only on a successful launch
 ):
     """
     Unified launcher:
@@ -57,7 +93,10 @@ def launch_app(
         return
 
     # Determine command for *this* OS when not using macOS `open -a`
-    cmd_this = (argv or [hint_tool])
+    cmd_this = list(argv or [hint_tool])
+    # Pre-resolve bare names so the spawn skips its own PATH walk
+    if "/" not in cmd_this[0]:
+        cmd_this[0] = _which(cmd_this[0]) or cmd_this[0]
 
     if kind == "gui":
         if IS_MACOS:
@@ -66,6 +105,8 @@ def launch_app(
             rc = subprocess.run(["/usr/bin/open", "-a", target]).returncode
             if rc != 0:
                 _missing_tool_hint(hint_tool, brew_pkg=(brew_pkg if brew_pkg is not None else hint_tool.lower()), brew_cask=brew_cask, stdscr=stdscr)
+            elif record_id:
+                record_last_used(record_id)
             return
         # Linux/other GUI path – fire-and-forget
         try:
@@ -74,6 +115,9 @@ def launch_app(
             _missing_tool_hint(hint_tool, brew_pkg=brew_pkg, apt_pkg=(apt_pkg if apt_pkg is not None else hint_tool.lower()), stdscr=stdscr)
         except Exception as e:
             error_dialog(stdscr, f"{label} failed: {e}", title=f"{label} ERROR")
+        else:
+            if record_id:
+                record_last_used(record_id)
         return
 
     # kind == "tui"
@@ -90,6 +134,8 @@ def launch_app(
             pass
 
     if rc == 0:
+        if record_id:
+            record_last_used(record_id)
         return
     if rc == 127:
         _missing_tool_hint(hint_tool, brew_pkg=brew_pkg, apt_pkg=(apt_pkg if apt_pkg is not None else hint_tool.lower()), stdscr=stdscr)
@@ -159,30 +205,46 @@ def _missing_tool_hint(
 # --- Last Used (lightweight, state-only) ---------------------------------------
 from typing import Optional
 
+def _xdg_base(var: str, default: Path) -> Path:
+    """XDG base dir: env value only when set and absolute (per spec), else default."""
+    val = os.environ.get(var)
+    return Path(val) if val and os.path.isabs(val) else default
+
 def _state_dir() -> Path:
-    xdg_state = os.environ.get("XDG_STATE_HOME")
-    base = Path(xdg_state) if xdg_state else Path.home() / ".local" / "state"
+    base = _xdg_base("XDG_STATE_HOME", Path.home() / ".local" / "state")
     d = base / "silo11writerdeck"
     d.mkdir(parents=True, exist_ok=True)
     return d
 
 _LAST_USED_FILE = _state_dir() / "last_used.txt"
+_LAST_USED_CACHE: tuple[int, Optional[str]] | None = None  # (st_mtime_ns, app id)
 
 def record_last_used(app_id: str) -> None:
     """Persist the last-used writing app id (e.g., 'vim', 'gedit')."""
+    global _LAST_USED_CACHE
+    app_id = app_id.strip()
+    if get_last_used() == app_id:
+        return  # unchanged; spare the SD card a write
     try:
-        _LAST_USED_FILE.write_text(app_id.strip() + "\n", encoding="utf-8")
+        _LAST_USED_FILE.write_text(app_id + "\n", encoding="utf-8")
+        # Seed the cache directly: coarse-mtime filesystems may not tick between writes
+        _LAST_USED_CACHE = (os.stat(_LAST_USED_FILE).st_mtime_ns, app_id or None)
     except Exception:
         # Non-fatal; launching should not fail because we couldn't write state.
         pass
 
 def get_last_used() -> Optional[str]:
-    """Return last-used app id or None if unknown."""
+    """Return last-used app id or None if unknown (re-read only when the file's mtime moves)."""
+    global _LAST_USED_CACHE
     try:
+        mtime = os.stat(_LAST_USED_FILE).st_mtime_ns
+        if _LAST_USED_CACHE is not None and _LAST_USED_CACHE[0] == mtime:
+            return _LAST_USED_CACHE[1]
         text = _LAST_USED_FILE.read_text(encoding="utf-8").strip()
-        return text or None
     except Exception:
         return None
+    _LAST_USED_CACHE = (mtime, text or None)
+    return text or None
 
 def run_app_and_record(app_id: str, cmd: list[str]) -> int:
     """
@@ -212,7 +274,6 @@ def draw_default_footer(stdscr):
 # ======================================================================
 
 def run_diary(stdscr=None):
-    record_last_used("diary")
     launch_app(
         stdscr,
         label="Diary",
@@ -221,10 +282,10 @@ def run_diary(stdscr=None):
         argv=["diary"],
         apt_pkg=False,
         brew_pkg="diary",
+        record_id="diary",
     )
 
 def run_emacs(stdscr=None):
-    record_last_used("emacs")
     launch_app(
         stdscr,
         label="Emacs",
@@ -233,10 +294,10 @@ def run_emacs(stdscr=None):
         argv=["emacs"],
         apt_pkg="emacs",
         brew_pkg="emacs",
+        record_id="emacs",
     )
 
 def run_gedit(stdscr=None):
-    record_last_used("gedit")
     launch_app(
         stdscr,
         label="Gedit",
@@ -246,10 +307,10 @@ def run_gedit(stdscr=None):
         argv=["gedit"],
         apt_pkg=False,
         brew_pkg="gedit",
+        record_id="gedit",
     )
 
 def run_nano(stdscr=None):
-    record_last_used("nano")
     launch_app(
         stdscr,
         label="Nano",
@@ -258,10 +319,10 @@ def run_nano(stdscr=None):
         argv=["nano"],
         apt_pkg="nano",
         brew_pkg="nano",
+        record_id="nano",
     )
 
 def run_obsidian(stdscr=None):
-    record_last_used("obsidian")
     launch_app(
         stdscr,
         label="Obsidian",
@@ -272,10 +333,10 @@ def run_obsidian(stdscr=None):
         apt_pkg=False,
         brew_pkg="obsidian",
         brew_cask=True,
+        record_id="obsidian",
     )
 
 def run_vim(stdscr=None):
-    record_last_used("vim")
     launch_app(
         stdscr,
         label="Vim",
@@ -284,10 +345,10 @@ def run_vim(stdscr=None):
         argv=["vim"],
         apt_pkg="vim",
         brew_pkg="vim",
+        record_id="vim",
     )
 
 def run_wordgrinder(stdscr=None):
-    record_last_used("wordgrinder")
     launch_app(
         stdscr,
         label="WordGrinder",
@@ -296,41 +357,64 @@ def run_wordgrinder(stdscr=None):
         argv=["wordgrinder"],
         apt_pkg="wordgrinder",
         brew_pkg="wordgrinder",
+        record_id="wordgrinder",
     )
 
 # ======================================================================
 #  File Operations
 # ======================================================================
 
+# XDG data home (not auto-created; the legacy repo stash stays the default)
+_DATA_DIR = _xdg_base("XDG_DATA_HOME", Path.home() / ".local" / "share") / "silo11writerdeck"
+
+@lru_cache(maxsize=4)
 def _choose_export_dir_and_url(preferred_rel: str = "silo11writerdeck/!save_files_here", home_dir: str | None = None):
-    """Choose export directory and compute URL path for UI."""
-    if home_dir is None:
-        home_dir = os.path.expanduser("~")
-
-    preferred_dir = os.path.join(home_dir, preferred_rel)
-    if os.path.isdir(preferred_dir):
-        # Our HTTP server serves EXPORT_DIR as its docroot, so the URL to it is simply "/".
-        EXPORT_DIR = preferred_dir
-        url_path = "/"
-    else:
-        # Fallback: serve $HOME at root (same URL path)
-        EXPORT_DIR = home_dir
-        url_path = "/"
+    """Choose export directory and compute URL path for UI (memoized per process)."""
+    home = Path(home_dir) if home_dir else Path.home()
+
+    # Our HTTP server serves EXPORT_DIR as its docroot, so the URL to it is simply "/".
+    url_path = "/"
+    for candidate in (_DATA_DIR / "save_files_here", home / preferred_rel):
+        if candidate.is_dir():
+            return str(candidate), url_path, str(home)
+
+    # Fallback: serve $HOME at root (same URL path)
+    return str(home), url_path, str(home)
+
+_LAN_IP_TTL = 30.0  # seconds; long enough for menu hopping, short enough to follow Wi-Fi changes
+_ip_cache = {"ts": float("-inf"), "ip": "127.0.0.1"}
+
+def _lan_ip() -> str:
+    """Outbound LAN IP (UDP connect sends no packet), memoized for _LAN_IP_TTL seconds."""
+    now = time.monotonic()
+    if now - _ip_cache["ts"] < _LAN_IP_TTL:
+        return _ip_cache["ip"]
+    ip = "127.0.0.1"
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            s.settimeout(0.1)
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
+        finally:
+            s.close()
+    except Exception:
+        pass
+    _ip_cache["ts"], _ip_cache["ip"] = now, ip
+    return ip
 
-    return EXPORT_DIR, url_path, home_dir
+def _port_open(port: int) -> bool:
+    """True if something listens on 127.0.0.1:port (loopback answers fast or not at all)."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.05):
+            return True
+    except OSError:
+        return False
 
 def run_builtin_http_server(stdscr, port: int = 8080):
     LOG = "/tmp/builtin_http_server.log"
     EXPORT_DIR, url_path, _home = _choose_export_dir_and_url()
 
-    def _port_open(p=port):
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(0.25)
-        try:
-            return s.connect_ex(("127.0.0.1", p)) == 0
-        finally:
-            s.close()
-
     cmd = ["python3", "-m", "http.server", str(port), "--directory", EXPORT_DIR]
 
     # DRY: use shared HUD so visuals & footer match main menu
@@ -339,7 +423,7 @@ def run_builtin_http_server(stdscr, port: int = 8080):
     except Exception:
         stdscr.clear()
 
-    if _port_open():
+    if _port_open(port):
         safe_addnstr_inner(stdscr, 4, 2, "📡 Built-in HTTP server already running.")
     else:
         with open(LOG, "ab", buffering=0) as f:
@@ -347,14 +431,7 @@ def run_builtin_http_server(stdscr, port: int = 8080):
         safe_addnstr_inner(stdscr, 4, 2, "📡 Built-in HTTP server started.")
 
     # Determine LAN IP
-    ip = "127.0.0.1"
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-    except Exception:
-        pass
+    ip = _lan_ip()
 
     safe_addnstr_inner(stdscr, 6, 2,  "Relay the dock to a runner device on the same LAN:")
     safe_addnstr_inner(stdscr, 8,  2, f"   http://{ip}:{port}{url_path}")
@@ -363,7 +440,9 @@ def run_builtin_http_server(stdscr, port: int = 8080):
     safe_addnstr_inner(stdscr, 14, 2, f"(logs: {LOG})")
     draw_default_footer(stdscr)
     safe_addnstr_inner(stdscr, 16, 2, "Press any key to return to menu.")
-    stdscr.refresh()
+    # One terminal flush for the whole screen build
+    stdscr.noutrefresh()
+    curses.doupdate()
     stdscr.getch()
 
 # ======================================================================
@@ -381,23 +460,28 @@ def run_nmtui_wifi(stdscr):
     if IS_MACOS:
         _macos_block(stdscr, "Wi-Fi", "System Settings → Wi-Fi")
         return
+    nmtui = _which("nmtui")
+    if nmtui is None:
+        # Resolved up front: no endwin/spawn round-trip just to hit ENOENT
+        _missing_tool_hint("nmtui", apt_pkg="network-manager", stdscr=stdscr)
+        return
     try:
         draw_silo_hud(stdscr, "NETWORK MANAGER // nmtui")
         stdscr.refresh(); time.sleep(0.15)
     except Exception:
         pass
     curses.endwin()
-    subprocess.run(["nmtui"])
+    subprocess.run([nmtui])
     stdscr.clear(); curses.doupdate()
 
 # ---------- Bluetoothctl Wrapper ----------
 
 # ----- shell helpers -----
-def _sh(cmd, timeout=10):
+def _sh(cmd, timeout=10, input=None):
     if isinstance(cmd, str):
         cmd = shlex.split(cmd)
     try:
-        p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False)
+        p = subprocess.run(cmd, input=input, capture_output=True, text=True, timeout=timeout, check=False)
         return p.returncode, p.stdout.strip(), p.stderr.strip()
     except Exception as e:
         # Make 'command not found' less cryptic for callers
@@ -409,35 +493,113 @@ def _sh(cmd, timeout=10):
 def _bt(args, timeout=10):
     return _sh(["bluetoothctl", "--"] + list(args), timeout=timeout)
 
+def _bt_rc(args, timeout=10) -> int:
+    """Return-code-only variant of _bt(): no pipes, no decode (output is discarded)."""
+    try:
+        return subprocess.run(
+            ["bluetoothctl", "--", *args],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout, check=False,
+        ).returncode
+    except FileNotFoundError:
+        return 127
+    except Exception:
+        return 1
+
+def _bt_session(commands, timeout=10):
+    """Run several bluetoothctl commands through one process (stdin script)."""
+    script = "\n".join([*commands, "quit"]) + "\n"
+    return _sh(["bluetoothctl"], timeout=timeout, input=script)
+
 def _short_mac(mac: str) -> str:
     return mac[-5:] if len(mac) >= 5 else mac
 
 # ----- low-level bluetooth ops -----
-def _bt_power(on=True):           return _bt(["power", "on" if on else "off"])
-def _bt_scan(on=True):            return _bt(["scan", "on" if on else "off"])
+def _bt_power(on=True):           return _bt_rc(["power", "on" if on else "off"])
 # def _bt_pair(mac):                return _bt(["pair", mac], timeout=10)      # 10s per request
 # def _bt_trust(mac):               return _bt(["trust", mac])
 def _bt_connect(mac):             return _bt(["connect", mac], timeout=10)   # 10s per request
 def _bt_remove(mac):              return _bt(["remove", mac])
 def _bt_info(mac):                return _bt(["info", mac])
 def _bt_agent_default():
-    _bt(["agent", "NoInputNoOutput"])
-    return _bt(["default-agent"])
+    return _bt_session(["agent NoInputNoOutput", "default-agent"])
 
 _DEVICE_LINE = re.compile(r"Device\s+([0-9A-Fa-f:]{17})\s*(.*)$")
+_ANSI_ESC    = re.compile(r"\x1b\[[0-9;]*[A-Za-z]|[\x01\x02]")
+_NEW_DEVICE  = re.compile(r"\[NEW\]\s+Device\s+([0-9A-Fa-f:]{17})")
 
-def _bt_devices():
-    rc, out, err = _bt(["devices"])
-    if rc != 0:
-        return rc, [], err
-    devs = []
-    for line in out.splitlines():
-        m = _DEVICE_LINE.match(line.strip())
+def _bt_scan_devices(seconds, enough=3, should_stop=None):
+    """
+    power on → scan on → poll → scan off → devices, all in ONE bluetoothctl session.
+    `scan on` is only sent once `power on` has been confirmed (bluetoothctl doesn't
+    wait for the Powered write, and discovery on an off adapter fails NotReady).
+    Polling ends at the deadline, once `enough` new devices were announced,
+    or when should_stop() returns True (e.g. a key press).
+    Returns (rc, [(mac, name)], err) like _bt_paired_devices().
+    """
+    try:
+        p = subprocess.Popen(
+            ["bluetoothctl"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        return 127, [], "bluetoothctl not found"
+    fd = p.stdout.fileno()
+    head = b""
+
+    def _read_some(timeout):
+        nonlocal head
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return True
+        chunk = os.read(fd, 65536)
+        head += chunk
+        return bool(chunk)  # False: bluetoothctl went away
+
+    def _text():
+        return _ANSI_ESC.sub("", head.decode("utf-8", "replace"))
+
+    try:
+        p.stdin.write(b"power on\n")
+        p.stdin.flush()
+        power_deadline = time.monotonic() + 5
+        while "Changing power on succeeded" not in (text := _text()):
+            left = power_deadline - time.monotonic()
+            if "Failed to set power" in text or left <= 0 or not _read_some(min(0.5, left)):
+                break
+        if "Failed to set power" not in text:
+            p.stdin.write(b"scan on\n")
+            p.stdin.flush()
+            deadline = time.monotonic() + seconds
+        else:
+            deadline = 0  # skip scanning; the parse below reports the failure
+        while (left := deadline - time.monotonic()) > 0:
+            if not _read_some(min(0.5, left)):
+                break
+            text = _text()
+            if "Failed to set power" in text or "Failed to start discovery" in text:
+                break
+            if len(set(_NEW_DEVICE.findall(text))) >= enough:
+                break
+            if should_stop is not None and should_stop():
+                break
+        tail, err = p.communicate(b"scan off\ndevices\nquit\n", timeout=10)
+    except Exception as e:
+        p.kill()
+        p.communicate()
+        return 1, [], str(e)
+
+    out = (head + tail).decode("utf-8", "replace")
+    found = {}  # mac -> name (dict keeps discovery order)
+    for line in _ANSI_ESC.sub("", out).splitlines():
+        if "Failed to set power" in line or "Failed to start discovery" in line:
+            return 1, [], line.strip()
+        # [CHG]/[DEL] lines carry property deltas, not names
+        if "[CHG]" in line or "[DEL]" in line:
+            continue
+        m = _DEVICE_LINE.search(line)
         if m:
-            mac = m.group(1)
-            name = m.group(2).strip()
-            devs.append((mac, name))
-    return 0, devs, ""
+            found[m.group(1)] = m.group(2).strip()
+    return 0, list(found.items()), err.decode("utf-8", "replace").strip()
 
 def _bt_paired_devices():
     rc, out, err = _bt(["paired-devices"])
@@ -455,65 +617,70 @@ def _bt_paired_devices():
 # ----- bluetooth UI helpers -----
 def _flash_status(stdscr, msg, delay=0.8):
     draw_silo_hud(stdscr, msg)
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    curses.doupdate()
     time.sleep(delay)
 
 def _labels_with_disambiguation(devs):
     """
-    devs: list[(mac, name)] ; returns labels[] with duplicate names suffixed ‹:xx:xx›
+    devs: list[(mac, name)] ; returns (labels[], entries[]) built in one pass:
+      labels  — display names, duplicates suffixed ‹:xx:xx›
+      entries — (mac, display name) per device, aligned with labels
     """
-    counts = {}
-    bases = []
-    for mac, nm in devs:
-        nm = (nm or "").strip()
-        base = nm if nm else mac
-        bases.append(base)
-        counts[base] = counts.get(base, 0) + 1
+    bases = [(nm or "").strip() or mac for mac, nm in devs]
+    counts = Counter(bases)
 
     labels = []
+    entries = []
     for (mac, nm), base in zip(devs, bases):
-        if counts.get(base, 0) > 1:
+        if counts[base] > 1:
             labels.append(f"{base} ‹{_short_mac(mac)}›")
         else:
             labels.append(base)
-    return labels
+        entries.append((mac, nm or mac))
+    return labels, entries
 
 # ----- Bluetooth Connect view (Paired only) -----
 def _view_connect(stdscr):
     """
     Lists paired devices only (fast; no scan). No icons in lists.
     """
-    _flash_status(stdscr, "Loading paired devices…", delay=0.2)
-    _bt_power(True)  # best effort
-
-    rc_p, paired, err_p = _bt_paired_devices()
-    if rc_p != 0:
-        # Tailored macOS message (no bluetoothctl/BlueZ)
-        if IS_MACOS and shutil.which("bluetoothctl") is None:
-            _macos_block(stdscr, "Bluetooth", "System Settings → Bluetooth")
-        return
+    rebuild = True
+    while True:
+        if rebuild:
+            rebuild = False
+            _flash_status(stdscr, "Loading paired devices…", delay=0.2)
+            _bt_power(True)  # best effort
+
+            rc_p, paired, err_p = _bt_paired_devices()
+            if rc_p != 0:
+                # Tailored macOS message (no bluetoothctl/BlueZ)
+                if IS_MACOS and not _have(HAVE_BLUETOOTHCTL, "bluetoothctl"):
+                    _macos_block(stdscr, "Bluetooth", "System Settings → Bluetooth")
+                return
 
-    paired_list = list(paired)
+            paired_list = list(paired)
 
-    labels = []
-    entries = []  # (mac, name) OR ("refresh"/"back", None)
-    if paired_list:
-        labels.append("— Paired —"); entries.append(("header", None))
-        labels += _labels_with_disambiguation(paired_list)
-        entries += [(mac, (nm or mac) or mac) for mac, nm in paired_list]
+            labels = []
+            entries = []  # (mac, name) OR ("refresh"/"back", None)
+            if paired_list:
+                labels.append("— Paired —"); entries.append(("header", None))
+                dev_labels, dev_entries = _labels_with_disambiguation(paired_list)
+                labels += dev_labels
+                entries += dev_entries
 
-    # Always provide refresh/back
-    labels += ["Refresh", "Back"]
-    entries += [("refresh", None), ("back", None)]
+            # Always provide refresh/back
+            labels += ["Refresh", "Back"]
+            entries += [("refresh", None), ("back", None)]
 
-    while True:
         idx = select_loop(stdscr, "BLUETOOTH // CONNECT (Paired)", labels, current=0)
         mac, name = entries[idx]
 
         if mac == "header":
             continue
         if mac == "refresh":
-            return _view_connect(stdscr)  # rebuild the view fresh
+            rebuild = True  # rebuild the view fresh
+            continue
         if mac == "back":
             return
 
@@ -534,7 +701,7 @@ def _view_connect(stdscr):
                     error_dialog(stdscr, f"Remove failed:\n{err or out}", title="Remove")
                 else:
                     _flash_status(stdscr, "Removed")
-                    return _view_connect(stdscr)  # refresh list
+                    rebuild = True  # refresh list
         elif pick == 2:
             rc, out, err = _bt_info(mac)
             if rc != 0:
@@ -547,20 +714,24 @@ def _view_connect(stdscr):
 # ----- Bluetooth Add Device (scan, then attempt direct connect; NO auto-pair/trust) -----
 def _view_add_device(stdscr, scan_seconds=6):
     _bt_agent_default()
-    _flash_status(stdscr, f"Scanning for ~{scan_seconds}s…", delay=0.1)
-    rc, _, err = _bt_power(True)
-    if rc != 0:
-        error_dialog(stdscr, f"Power on failed:\n{err}", title="Power")
-        return
+    _flash_status(stdscr, f"Scanning for ~{scan_seconds}s… (any key to stop)", delay=0.1)
 
-    _bt_scan(True); time.sleep(max(3, int(scan_seconds))); _bt_scan(False)
+    def _key_pressed():
+        stdscr.nodelay(True)
+        try:
+            return stdscr.getch() != -1
+        finally:
+            stdscr.nodelay(False)
 
-    rc, devs, err = _bt_devices()
+    rc, devs, err = _bt_scan_devices(max(3, int(scan_seconds)), should_stop=_key_pressed)
+    if rc != 0 and "power" in err.lower():
+        error_dialog(stdscr, f"Power on failed:\n{err}", title="Power")
+        return
     if rc != 0 or not devs:
         error_dialog(stdscr, "No devices discovered. Try again.", title="Scan")
         return
 
-    labels = _labels_with_disambiguation(devs) + ["Back"]
+    labels = _labels_with_disambiguation(devs)[0] + ["Back"]
     pick = select_loop(stdscr, "ADD DEVICE // SELECT TARGET", labels, current=0)
     if pick == len(labels) - 1:
         return
@@ -627,12 +798,11 @@ def run_bluetoothctl_shell(stdscr):
     'Add Device' scans and lets you attempt Connect (no auto-pair/trust).
     """
     # Proactive macOS check so we show a helpful dialog instead of crashing later.
-    if IS_MACOS and shutil.which("bluetoothctl") is None:
+    if IS_MACOS and not _have(HAVE_BLUETOOTHCTL, "bluetoothctl"):
         _macos_block(stdscr, "Bluetooth", "System Settings → Bluetooth")
         return
 
-    _bt_agent_default()  # smoother pairing
-
+    # Agent registration is deferred to Add Device; Connect/Controllers never need it.
     MENU = [
         ("Connect (Paired)", "☍", _view_connect),
         ("Add Device (Scan → Connect)", "⌕", _view_add_device),
@@ -640,9 +810,7 @@ def run_bluetoothctl_shell(stdscr):
         ("Back", "◀", None),
     ]
 
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
+    labels, icons, actions = (list(col) for col in zip(*MENU))
 
     while True:
         choice = select_loop(stdscr, "BLUETOOTH // CONTROL DECK", labels, icons=icons, current=0)
@@ -659,9 +827,10 @@ def run_bluetoothctl_shell(stdscr):
 # ---------- Screen Rotation ----------
 def get_current_rotation() -> int | None:
     if not CONFIG.exists(): return None
-    for line in CONFIG.read_text(errors="ignore").splitlines():
-        m = re.match(rf"^\s*{KEY}\s*=\s*([0-3])\s*(#.*)?$", line)
-        if m: return int(m.group(1))
+    with CONFIG.open("r", errors="ignore") as f:
+        for line in f:
+            m = _ROT_RE.match(line)
+            if m: return int(m.group(1))
     return None
 
 def set_rotation(rot_val: int) -> None:
@@ -718,6 +887,13 @@ def launch_theme_switcher_action(stdscr):
         if val is None:  # 'Back'
             return
 
+        if get_theme() == val:
+            # Already active: skip persisting + rebuilding every color pair
+            draw_silo_hud(stdscr, f"THEME ALREADY: {label.upper()}  {icon}")
+            stdscr.refresh()
+            time.sleep(0.15)
+            continue
+
         try:
             # Persist choice and update current session palette
             set_theme(val)
@@ -741,27 +917,33 @@ def launch_theme_switcher_action(stdscr):
 #     # Expand ~ and $VARS in user-provided paths
 #     return os.path.expandvars(os.path.expanduser(path))
 
-def _find_tool(preferred: str, fallbacks: list[str]) -> str | None:
+@lru_cache(maxsize=32)
+def _find_tool(preferred: str, fallbacks: tuple[str, ...]) -> str | None:
     """
     Return a shell-safe command string to run the first existing tool.
+    Pure-Python resolution (no shell spawn per candidate), memoized per process;
+    call _find_tool.cache_clear() after anything that (un)installs the tools.
     """
     candidates = [preferred, *fallbacks]
     for c in candidates:
-        # Allow either absolute path or a bare command that resolves via PATH
+        c = os.path.expandvars(os.path.expanduser(c))
+        # Allow either a path (absolute or ./relative) or a bare command that resolves via PATH
         if "/" in c:
             if Path(c).exists():
                 return c
         else:
-            # Test if the command exists in PATH
-            chk = subprocess.run(["bash", "-lc", f"command -v {c} >/dev/null 2>&1"])
-            if chk.returncode == 0:
-                return c
+            found = _which(c)
+            if found:
+                return found
     return None
 
-def _safe_addstr(win, y: int, x: int, s: str, maxw: int | None = None):
-    """Safely write within screen bounds; avoid bottom-right overflow."""
+# ncurses pads are limited to a signed short of rows
+_PAD_MAX_LINES = 32767
+
+def _safe_addstr(win, y: int, x: int, s: str, maxw: int | None = None, dims: tuple[int, int] | None = None):
+    """Safely write within screen bounds; avoid bottom-right overflow. Pass dims=(h, w) if already known."""
     try:
-        h, w = win.getmaxyx()
+        h, w = dims or win.getmaxyx()
         if y < 0 or y >= h or x < 0 or x >= w:
             return
         limit = w - x
@@ -779,59 +961,108 @@ def _show_output_pager(stdscr, title: str, text: str):
     """
     Minimal scrollable pager inside curses.
     Keys: ↑/↓, PgUp/PgDn, Space, g (top), G (bottom), q/ESC to exit.
+    The body is rendered once into an off-screen pad; scrolling only changes
+    which slice of the pad gets copied to the screen.
     """
     lines = text.splitlines() or [""]
+    if len(lines) > _PAD_MAX_LINES:
+        dropped = len(lines) - (_PAD_MAX_LINES - 1)
+        lines = lines[:_PAD_MAX_LINES - 1] + [f"… truncated ({dropped} more lines)"]
+    # No horizontal scrolling: the pad is exactly screen-wide. Sizing it from
+    # len() would undercount wide glyphs (✅/❌ take two cells) and wrap them
+    pad_w = max(1, curses.COLS)
+    try:
+        pad = curses.newpad(len(lines), pad_w)
+    except curses.error:
+        error_dialog(stdscr, f"Output too large to display ({len(lines)} lines).", title=title)
+        return
+    pad_dims = (len(lines), pad_w)
+    for i, line in enumerate(lines):
+        _safe_addstr(pad, i, 0, line, dims=pad_dims)
+
     top = 0
-    while True:
-        h, w = stdscr.getmaxyx()
-        stdscr.erase()
-        if h < 2 or w < 2:
-            stdscr.refresh()
+    full = True
+    hint = " Press q/ESC to exit "
+    stdscr.leaveok(True)   # no cursor-positioning escapes per update
+    h, w = stdscr.getmaxyx()  # re-read only on KEY_RESIZE
+    try:
+        while True:
+            if h < 2 or w < 2:
+                stdscr.erase()
+                stdscr.refresh()
+                ch = stdscr.getch()
+                if ch in (ord('q'), 27):
+                    return
+                if ch == curses.KEY_RESIZE:
+                    h, w = stdscr.getmaxyx()
+                full = True
+                continue
+
+            body_h = max(1, h - 3)  # one extra line reserved for hint/footer
+            max_top = max(0, len(lines) - body_h)
+
+            if full:
+                stdscr.erase()
+                # Header
+                header = f" {title} — {len(lines)} lines "
+                _safe_addstr(stdscr, 0, 0, header, dims=(h, w))
+                full = False
+
+            # Footer + hint (always cheap to repaint)
+            footer = f" {top+1}-{min(top+body_h, len(lines))} of {len(lines)} "
+            footer_line = f"{footer.ljust(max(0, w - len(hint)))}{hint}"
+            stdscr.move(h - 1, 0)
+            stdscr.clrtoeol()
+            _safe_addstr(stdscr, h - 1, 0, footer_line, dims=(h, w))
+
+            # Body: copy the visible pad slice over rows 1..body_h (last column left alone)
+            stdscr.noutrefresh()
+            try:
+                pad.noutrefresh(top, 0, 1, 0, min(body_h, h - 2), max(0, w - 2))
+            except curses.error:
+                pass
+            curses.doupdate()
+
             ch = stdscr.getch()
-            if ch in (ord('q'), 27):
+            if ch in (ord('q'), 27):  # q or ESC
                 return
-            continue
-
-        # Header
-        header = f" {title} — {len(lines)} lines "
-        _safe_addstr(stdscr, 0, 0, header)
-
-        # Body
-        body_h = max(1, h - 3)  # one extra line reserved for hint/footer
-        for i in range(body_h):
-            idx = top + i
-            if idx >= len(lines):
-                break
-            _safe_addstr(stdscr, 1 + i, 0, lines[idx])
-
-        # Footer + hint
-        footer = f" {top+1}-{min(top+body_h, len(lines))} of {len(lines)} "
-        hint   = " Press q/ESC to exit "
-        footer_line = f"{footer.ljust(max(0, w - len(hint)))}{hint}"
-        _safe_addstr(stdscr, h - 1, 0, footer_line)
+            elif ch == curses.KEY_DOWN:
+                top = min(max_top, top + 1)
+            elif ch == curses.KEY_UP:
+                top = max(0, top - 1)
+            elif ch in (curses.KEY_NPAGE, ord(' ')):
+                top = min(max_top, top + body_h)
+            elif ch == curses.KEY_PPAGE:
+                top = max(0, top - body_h)
+            elif ch == ord('g'):
+                top = 0
+            elif ch == ord('G'):
+                top = max_top
+            elif ch == curses.KEY_RESIZE:
+                h, w = stdscr.getmaxyx()
+                top, full = min(top, max(0, len(lines) - max(1, h - 3))), True
+            else:
+                # ignore all other keys
+                continue
+    finally:
+        stdscr.leaveok(False)
 
-        stdscr.refresh()
-
-        ch = stdscr.getch()
-        if ch in (ord('q'), 27):  # q or ESC
-            return
-        elif ch == curses.KEY_DOWN:
-            if top + body_h < len(lines):
-                top += 1
-        elif ch == curses.KEY_UP:
-            if top > 0:
-                top -= 1
-        else:
-            # ignore all other keys
-            continue
+_SHELL_META = re.compile(r"[\s;&|<>()$`\\\"'*?\[\]{}~#!]")
 
 def _run_cli_tool_pager(stdscr, label: str, cmd: str):
     """
     Capture stdout+stderr and show in a scrollable TUI pager. Exit code drives the toast color.
     """
-    # Run the command via bash -lc so PATH/aliases/env apply
+    # A resolved, executable path runs directly; anything else goes via bash -lc so PATH/aliases/env apply
+    if os.path.isabs(cmd) and not _SHELL_META.search(cmd) and os.access(cmd, os.X_OK):
+        argv = [cmd]
+    elif _have(HAVE_BASH, "bash"):
+        argv = ["bash", "-lc", cmd]
+    else:
+        error_dialog(stdscr, f"{label} needs bash to run: {cmd}", title="TOOL MISSING")
+        return
     proc = subprocess.run(
-        ["bash", "-lc", cmd],
+        argv,
         text=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -850,7 +1081,7 @@ def _run_cli_tool_pager(stdscr, label: str, cmd: str):
 def launch_healthcheck_action(stdscr):
     cmd = _find_tool(
         "~/.local/bin/healthcheck-silo11writerdeck",
-        ["healthcheck-silo11writerdeck", "./healthcheck-silo11writerdeck.sh"],
+        ("healthcheck-silo11writerdeck", "./healthcheck-silo11writerdeck.sh"),
     )
     if not cmd:
         error_dialog(stdscr, "Health Check tool not found.", title="TOOL MISSING")
@@ -860,12 +1091,14 @@ def launch_healthcheck_action(stdscr):
 def launch_update_action(stdscr):
     cmd = _find_tool(
         "~/.local/bin/update-silo11writerdeck",
-        ["update-silo11writerdeck", "./update-silo11writerdeck.sh"],
+        ("update-silo11writerdeck", "./update-silo11writerdeck.sh"),
     )
     if not cmd:
         error_dialog(stdscr, "Update tool not found.", title="TOOL MISSING")
         return
     _run_cli_tool_pager(stdscr, "Update", cmd)
+    _find_tool.cache_clear()  # update may have (re)installed the tools
+    _rescan_tools()           # ...and apt packages (bluetoothctl, nmcli, …)
 
 def launch_uninstall_action(stdscr):
     if not confirm_action(stdscr, "Uninstall"):
@@ -874,12 +1107,14 @@ def launch_uninstall_action(stdscr):
 
     cmd = _find_tool(
         "~/.local/bin/uninstall-silo11writerdeck",
-        ["uninstall-silo11writerdeck", "./uninstall-silo11writerdeck.sh"],
+        ("uninstall-silo11writerdeck", "./uninstall-silo11writerdeck.sh"),
     )
     if not cmd:
         error_dialog(stdscr, "Uninstall tool not found.", title="TOOL MISSING")
         return
     _run_cli_tool_pager(stdscr, "Uninstall", cmd)
+    _find_tool.cache_clear()  # uninstall removed the tools
+    _rescan_tools()           # ...and their cached PATH lookups
 
 
 # ======================================================================
@@ -888,11 +1123,11 @@ def launch_uninstall_action(stdscr):
 
 def bt_power(on: bool, stdscr=None):
     # On macOS (no BlueZ/bluetoothctl), show managed-by-macOS dialog.
-    if IS_MACOS or shutil.which("bluetoothctl") is None:
+    if IS_MACOS or not _have(HAVE_BLUETOOTHCTL, "bluetoothctl"):
         _macos_block(stdscr, "Bluetooth", "System Settings → Bluetooth")
         return
-    # Linux / BlueZ path
-    rc, out, err = _bt_power(on)
+    # Linux / BlueZ path (full _bt: output feeds the error dialog)
+    rc, out, err = _bt(["power", "on" if on else "off"])
     if rc != 0:
         if stdscr is not None:
             error_dialog(stdscr, f"Bluetooth power {'on' if on else 'off'} failed:\n{err or out}", title="Bluetooth Power")
@@ -900,7 +1135,7 @@ def bt_power(on: bool, stdscr=None):
             print(f"⛓️  [silo] Bluetooth power {'on' if on else 'off'} failed: {err or out}")
 
 def wifi_power(on: bool, stdscr=None):
-    if IS_MACOS or shutil.which("nmcli") is None:
+    if IS_MACOS or not _have(HAVE_NMCLI, "nmcli"):
         _macos_block(stdscr, "Wi-Fi", "System Settings → Wi-Fi")
         return
     cmd = ["nmcli", "radio", "wifi", "on" if on else "off"]
@@ -931,12 +1166,6 @@ def run_custom_http_server(stdscr, port: int = 8080):
     SCRIPT = "/usr/local/bin/export_http_server.py"
     EXPORT_DIR, url_path, _home = _choose_export_dir_and_url()
 
-    def _port_open(p=port):
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(0.25)
-        try: return s.connect_ex(("127.0.0.1", p)) == 0
-        finally: s.close()
-
     # DRY: shared HUD (keeps patina/frame/rail/footer consistent)
     try:
         draw_silo_hud(stdscr, "TRANSMIT TO THE WASTES // TRANSMISSION UPLINK")
@@ -954,7 +1183,7 @@ def run_custom_http_server(stdscr, port: int = 8080):
 
     cmd = ["/usr/bin/python3", SCRIPT, "--dir", EXPORT_DIR, "--list"]
 
-    if _port_open():
+    if _port_open(port):
         safe_addnstr_inner(stdscr, 4, 2, "📡 Transmission already active.")
     else:
         with open(LOG, "ab", buffering=0) as f:
@@ -962,13 +1191,7 @@ def run_custom_http_server(stdscr, port: int = 8080):
         safe_addnstr_inner(stdscr, 4, 2, "📡 Transmission broadcast engaged.")
 
     # LAN IP
-    ip = "127.0.0.1"
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-    except Exception: pass
+    ip = _lan_ip()
 
     safe_addnstr_inner(stdscr, 6, 2,  "Relay the signal to operatives in the wastes:")
     safe_addnstr_inner(stdscr, 8,  2, f"   http://{ip}:{port}{url_path}")
@@ -987,6 +1210,7 @@ def _read_input_curses(stdscr, prompt: str, hidden: bool = False) -> str:
     y, x = stdscr.getyx()
     safe_addnstr_inner(stdscr, y, max(2, x), prompt)
     stdscr.refresh()
+    y, x0 = stdscr.getyx()  # input starts right after the prompt; cursor tracked locally from here
     buf = []
     while True:
         ch = stdscr.getch()
@@ -997,20 +1221,32 @@ def _read_input_curses(stdscr, prompt: str, hidden: bool = False) -> str:
         if ch in (curses.KEY_BACKSPACE, 127, 8):
             if buf:
                 buf.pop()
-                y, x = stdscr.getyx()
-                stdscr.move(y, max(0, x - 1))
-                stdscr.delch()
-                stdscr.refresh()
+                x = x0 + len(buf)
+                try:
+                    stdscr.addch(y, x, " ")
+                    stdscr.move(y, x)
+                except curses.error:
+                    pass
+                stdscr.noutrefresh()
+                curses.doupdate()
             continue
         if 32 <= ch <= 126:
+            x = x0 + len(buf)
             buf.append(chr(ch))
-            stdscr.addch(ord("*") if hidden else ch)
-            stdscr.refresh()
+            try:
+                stdscr.addch(y, x, ord("*") if hidden else ch)
+            except curses.error:
+                pass  # ran off the window edge; keep the char, stop echoing
+            stdscr.noutrefresh()
+            curses.doupdate()
     return "".join(buf)
 
+# One wpa_cli scan_results row: bssid, frequency, signal level, flags, ssid (tab-separated)
+_SCAN_ROW = re.compile(r"^([0-9a-f:]{17})\t(\S+)\t(\S+)\t(\S*)\t(.+)$", re.M | re.I)
+
 def run_custom_wifi(stdscr):
     """Scan for networks and connect using wpa_cli."""
-    if IS_MACOS or shutil.which("wpa_cli") is None:
+    if IS_MACOS or not _have(HAVE_WPA_CLI, "wpa_cli"):
         _macos_block(stdscr, "Wi-Fi", "System Settings → Wi-Fi")
         return
     try:
@@ -1023,9 +1259,17 @@ def run_custom_wifi(stdscr):
     def _safe_run(cmd):
         return subprocess.run(cmd, capture_output=True, text=True)
 
+    # scan_results answers from the cached BSS table immediately, so a fresh scan
+    # is only done once the table differs from the snapshot taken before `scan`
+    # (or the deadline passes; then the latest table is the best there is)
+    before = _safe_run(["sudo", "wpa_cli", "scan_results"]).stdout
     _safe_run(["sudo", "wpa_cli", "scan"])
-    time.sleep(3)
-    result = _safe_run(["sudo", "wpa_cli", "scan_results"])
+    deadline = time.monotonic() + 5.0
+    while True:
+        time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+        result = _safe_run(["sudo", "wpa_cli", "scan_results"])
+        if result.stdout != before or time.monotonic() >= deadline:
+            break
     lines = result.stdout.strip().split("\n")
 
     if len(lines) <= 1:
@@ -1034,16 +1278,9 @@ def run_custom_wifi(stdscr):
         stdscr.getch()
         return
 
-    # Parse scan results
-    entries = []
-    for line in lines[1:]:
-        cols = line.split("\t")
-        if len(cols) >= 5 and cols[4].strip():
-            entries.append((cols[4], cols[2], cols[3], cols[0]))
-    try:
-        entries.sort(key=lambda x: int(x[1]), reverse=True)
-    except ValueError:
-        pass
+    # Parse scan results (bssid, freq, signal, flags, ssid) in one pass over the blob
+    entries = [(m[5], m[3], m[4], m[1]) for m in _SCAN_ROW.finditer(result.stdout) if m[5].strip()]
+    entries.sort(key=lambda e: int(e[1]) if e[1].lstrip("-").isdigit() else 0, reverse=True)
     entries = entries[:10]
 
     try:
@@ -1095,22 +1332,40 @@ def run_custom_wifi(stdscr):
         return
 
     net_id = add.stdout.strip()
-    _safe_run(["sudo", "wpa_cli", "set_network", net_id, "ssid", f"\"{ssid}\""])
-    if psk:
-        _safe_run(["sudo", "wpa_cli", "set_network", net_id, "psk", f"\"{psk}\""])
-    else:
-        _safe_run(["sudo", "wpa_cli", "set_network", net_id, "key_mgmt", "NONE"])
-
-    _safe_run(["sudo", "wpa_cli", "select_network", net_id])
-    _safe_run(["sudo", "wpa_cli", "enable_network", net_id])
-    _safe_run(["sudo", "wpa_cli", "save_config"])
+    # Everything after add_network goes through one wpa_cli session on stdin (one sudo fork)
+    secret = f"psk \"{psk}\"" if psk else "key_mgmt NONE"
+    batch = (
+        f"set_network {net_id} ssid \"{ssid}\"\n"
+        f"set_network {net_id} {secret}\n"
+        f"select_network {net_id}\n"
+        f"enable_network {net_id}\n"
+        "save_config\n"
+        "quit\n"
+    )
+    subprocess.run(["sudo", "wpa_cli"], input=batch, capture_output=True, text=True)
 
     safe_addnstr_inner(stdscr, base_y + len(entries) + 8, 2, "📡 Attempting link-up… (this may take a few seconds)")
     stdscr.refresh()
-    time.sleep(4)
 
-    status = _safe_run(["sudo", "wpa_cli", "status"]).stdout
-    if "wpa_state=COMPLETED" in status:
+    def _linked(status_text: str) -> bool:
+        # COMPLETED alone may still describe the previous network right after select_network
+        st = dict(l.split("=", 1) for l in status_text.splitlines() if "=" in l)
+        return st.get("wpa_state") == "COMPLETED" and st.get("id") == net_id and st.get("ssid") == ssid
+
+    # Poll status with a short backoff (100 → 200 → 400ms) up to 5s instead of a flat 4s sleep
+    deadline = time.monotonic() + 5.0
+    delay = 0.1
+    while True:
+        linked = _linked(_safe_run(["sudo", "wpa_cli", "status"]).stdout)
+        left = deadline - time.monotonic()
+        if linked or left <= 0:
+            break
+        draw_centered_inner(stdscr, base_y + len(entries) + 9, f"⏳ Waiting for handshake… {left:0.1f}s ")
+        stdscr.refresh()
+        time.sleep(min(delay, left))
+        delay = min(delay * 2, 0.4)
+
+    if linked:
         safe_addnstr_inner(stdscr, base_y + len(entries) + 10, 2, "✅ Link established. Press any key to return.")
     else:
         safe_addnstr_inner(stdscr, base_y + len(entries) + 10, 2, "⚠️  Link not confirmed yet. Press any key to return.")
@@ -1139,10 +1394,16 @@ def launch_custom_bluetooth(stdscr, seconds: int = 10):
         stdscr.clear()
     safe_addnstr_inner(stdscr, 4, 2, f"🛰️  Beacon open — discoverable/pairable for {seconds} seconds…")
     stdscr.refresh()
-    for i in range(seconds, 0, -1):
-        safe_addnstr_inner(stdscr, 5, 2, f"⌛ Time remaining: {i:2d}s   ")
-        stdscr.refresh()
-        time.sleep(1)
+    # Per tick only the countdown digits change; flush just that diff, no cursor moves
+    stdscr.leaveok(True)
+    try:
+        for i in range(seconds, 0, -1):
+            safe_addnstr_inner(stdscr, 5, 2, f"⌛ Time remaining: {i:2d}s   ")
+            stdscr.noutrefresh()
+            curses.doupdate()
+            time.sleep(1)
+    finally:
+        stdscr.leaveok(False)
     safe_addnstr_inner(stdscr, 7, 2, "🔒 Beacon sealed. Press any key to return.")
     stdscr.refresh()
     stdscr.getch()
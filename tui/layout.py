@@ -7,11 +7,12 @@
 from __future__ import annotations
 import curses
 import random
+from collections import Counter
 
 from .theme import (
     PAIR_HAZARD, PAIR_BORDER, PAIR_RIVET, PAIR_BOLT, PAIR_PATINA, PAIR_STATIC,
     PAIR_HEADER,
-    BOLT, RIVET, HAZ_CHARS, PATINA,
+    BOLT, RIVET, HAZ_CHARS, PATINA_CHARS, PATINA_WEIGHTS,
     BOLT_STEP, PATINA_DENSITY, STATIC_DENSITY, STATIC_WEIGHTS,
     HEADER_GUARD_ROW,
 )
@@ -57,6 +58,10 @@ def safe_addnstr(stdscr, y: int, x: int, text: str, n: int | None = None, attr:
     except Exception:
         pass
 
+def _fast_addnstr(win, y: int, x: int, s: str, n: int, a: int) -> None:
+    """Unchecked addnstr for hot loops whose coordinates the caller already clamped."""
+    win.addnstr(y, x, s, n, a)
+
 # --------- Layout Logic -------------------
 
 def draw_centered(stdscr, y: int, text: str, attr: int = 0) -> None:
@@ -80,11 +85,19 @@ def draw_patina(stdscr, density: float | None = None) -> None:
     y_min = min(HEADER_GUARD_ROW + 1, h - 1)
     y_max = max(y_min, h - 2)
     x_min, x_max = 1, max(1, w - 2)
-    for _ in range(samples):
-        y = random.randrange(y_min, y_max + 1) if y_max >= y_min else y_min
-        x = random.randrange(x_min, x_max + 1) if x_max >= x_min else x_min
-        ch = random.choice(PATINA)
-        safe_addnstr(stdscr, y, x, ch, 1, curses.color_pair(PAIR_PATINA))
+    # Bulk RNG: three C-level choices() calls instead of 3 Python calls per sample
+    ys  = random.choices(range(y_min, y_max + 1), k=samples)
+    xs  = random.choices(range(x_min, x_max + 1), k=samples)
+    chs = random.choices(PATINA_CHARS, PATINA_WEIGHTS, k=samples)
+    attr = curses.color_pair(PAIR_PATINA)
+    # Bounds are checked once here; tiny windows fall back to the guarded writer
+    put = _fast_addnstr if (0 <= y_min and y_max < h and x_max < w - 1) else safe_addnstr
+    for y, x, ch in zip(ys, xs, chs):
+        put(stdscr, y, x, ch, 1, attr)
+
+# Pre-built splotch rows, keyed by shape width (one addnstr per row instead of per cell)
+_STATIC_ROWS = {1: "▒", 2: "▒▒", 3: "▒▒▒"}
+_STATIC_SHAPES = ((1, 1), (2, 2), (2, 3))  # (rows, cols), aligned with STATIC_WEIGHTS
 
 def draw_static(stdscr, density: float | None = None, weights: tuple[float, float, float] | None = None) -> None:
     if density is None:
@@ -98,63 +111,81 @@ def draw_static(stdscr, density: float | None = None, weights: tuple[float, floa
     y_min = min(HEADER_GUARD_ROW + 1, h - 1)
     x_min = 2
 
-    for _ in range(count):
-        r = random.random()
-        if r < weights[0]:
-            sh, sw = 1, 1
-        elif r < weights[0] + weights[1]:
-            sh, sw = 2, 2
-        else:
-            sh, sw = 2, 3
+    # Bulk RNG: pick every splotch shape at once, then positions per shape group
+    # (shape i is used when r < cumulative weight i, same as a per-sample random())
+    cum = (weights[0], weights[0] + weights[1], max(1.0, weights[0] + weights[1]))
+    shapes = Counter(random.choices(_STATIC_SHAPES, cum_weights=cum, k=count))
+    attr = curses.color_pair(PAIR_STATIC)
 
+    for (sh, sw), n in shapes.items():
         y_max = max(y_min, h - 1 - sh)
         x_max = max(x_min, w - 1 - sw)
-        if y_min > y_max or x_min > x_max:
-            break
-
-        y = random.randrange(y_min, y_max + 1)
-        x = random.randrange(x_min, x_max + 1)
-
-        for dy in range(sh):
-            yy = y + dy
-            if yy <= HEADER_GUARD_ROW:
-                continue
-            for dx in range(sw):
-                xx = x + dx
-                safe_addnstr(stdscr, yy, xx, "▒", 1, curses.color_pair(PAIR_STATIC))
+        ys = random.choices(range(y_min, y_max + 1), k=n)
+        xs = random.choices(range(x_min, x_max + 1), k=n)
+
+        row = _STATIC_ROWS[sw]
+        put = _fast_addnstr if (0 <= y_min and y_max + sh < h and x_max + sw < w) else safe_addnstr
+        for y, x in zip(ys, xs):
+            for dy in range(sh):
+                yy = y + dy
+                if yy <= HEADER_GUARD_ROW:
+                    continue
+                put(stdscr, yy, x, row, sw, attr)
+
+# Per-width string caches: the terminal width rarely changes between HUD draws
+_RULE_CACHE: dict[int, str] = {}
+_HAZ_PATTERN_CACHE: dict[int, str] = {}
+_BOLT_COLS_CACHE: dict[int, tuple[int, ...]] = {}
+
+def _bolt_columns(w: int) -> tuple[int, ...]:
+    """Bolt x positions for a given width (every BOLT_STEP, plus both inner ends)."""
+    cols = _BOLT_COLS_CACHE.get(w)
+    if cols is None:
+        cols = _BOLT_COLS_CACHE.setdefault(
+            w, tuple(x for x in range(1, w - 1) if (x % BOLT_STEP == 1) or x in (1, w - 2))
+        )
+    return cols
 
 def draw_riveted_frame(stdscr) -> None:
     h, w = stdscr.getmaxyx()
     if h < 3 or w < 8:
         return
 
-    safe_addnstr(stdscr, 0,     0,     "┌", 1, curses.color_pair(PAIR_BORDER))
-    safe_addnstr(stdscr, 0,     w - 1, "┐", 1, curses.color_pair(PAIR_BORDER))
-    safe_addnstr(stdscr, h - 1, 0,     "└", 1, curses.color_pair(PAIR_BORDER))
-    safe_addnstr(stdscr, h - 1, w - 1, "┘", 1, curses.color_pair(PAIR_BORDER))
+    border = curses.color_pair(PAIR_BORDER)
+    rivet  = curses.color_pair(PAIR_RIVET)
+    bolt   = curses.color_pair(PAIR_BOLT)
+
+    safe_addnstr(stdscr, 0,     0,     "┌", 1, border)
+    safe_addnstr(stdscr, 0,     w - 1, "┐", 1, border)
+    safe_addnstr(stdscr, h - 1, 0,     "└", 1, border)
+    safe_addnstr(stdscr, h - 1, w - 1, "┘", 1, border)
 
     if w > 2:
-        safe_addnstr(stdscr, 0,     1, "─" * (w - 2), w - 2, curses.color_pair(PAIR_BORDER))
-        safe_addnstr(stdscr, h - 1, 1, "─" * (w - 2), w - 2, curses.color_pair(PAIR_BORDER))
+        rule = _RULE_CACHE.get(w - 2) or _RULE_CACHE.setdefault(w - 2, "─" * (w - 2))
+        safe_addnstr(stdscr, 0,     1, rule, w - 2, border)
+        safe_addnstr(stdscr, h - 1, 1, rule, w - 2, border)
 
     for y in range(1, h - 1):
-        safe_addnstr(stdscr, y, 0,     "│", 1, curses.color_pair(PAIR_BORDER))
-        safe_addnstr(stdscr, y, w - 1, "│", 1, curses.color_pair(PAIR_BORDER))
+        safe_addnstr(stdscr, y, 0,     "│", 1, border)
+        safe_addnstr(stdscr, y, w - 1, "│", 1, border)
 
     for y in range(2, h - 2, 3):
-        safe_addnstr(stdscr, y, 0,     RIVET, 1, curses.color_pair(PAIR_RIVET))
-        safe_addnstr(stdscr, y, w - 1, RIVET, 1, curses.color_pair(PAIR_RIVET))
+        safe_addnstr(stdscr, y, 0,     RIVET, 1, rivet)
+        safe_addnstr(stdscr, y, w - 1, RIVET, 1, rivet)
 
-    for x in range(1, w - 1):
-        if (x % BOLT_STEP == 1) or x in (1, w - 2):
-            safe_addnstr(stdscr, 0, x, BOLT, 1, curses.color_pair(PAIR_BOLT))
+    for x in _bolt_columns(w):
+        safe_addnstr(stdscr, 0, x, BOLT, 1, bolt)
 
 def draw_hazard_header(stdscr, title: str) -> None:
     h, w = stdscr.getmaxyx()
     if w < 12:
         return
     inner_w = max(0, w - 2)
-    pattern = "".join(HAZ_CHARS[(x // 2) % len(HAZ_CHARS)] for x in range(inner_w))
+    pattern = _HAZ_PATTERN_CACHE.get(inner_w)
+    if pattern is None:
+        pattern = _HAZ_PATTERN_CACHE.setdefault(
+            inner_w, "".join(HAZ_CHARS[(x // 2) % len(HAZ_CHARS)] for x in range(inner_w))
+        )
     safe_addnstr(stdscr, 1, 1, pattern, inner_w, curses.color_pair(PAIR_HAZARD))
     # Clip the title to the inner width so we never overrun the frame on tiny terminals.
     raw = f"[ {title} ]"
@@ -168,9 +199,9 @@ def draw_bottom_bolt_rail(stdscr) -> None:
     y = h - 1
     if y < 0:
         return
-    for x in range(1, w - 1):
-        if (x % BOLT_STEP == 1) or x in (1, w - 2):
-            safe_addnstr(stdscr, y, x, BOLT, 1, curses.color_pair(PAIR_BOLT))
+    bolt = curses.color_pair(PAIR_BOLT)
+    for x in _bolt_columns(w):
+        safe_addnstr(stdscr, y, x, BOLT, 1, bolt)
 
 __all__ = [
     # low-level drawing
@@ -3,7 +3,6 @@
 # Description: curses TUI (design split into theme/layout/widgets)
 
 import curses
-import time
 import subprocess
 
 from .actions import (
@@ -48,6 +47,9 @@ from .actions import (
     run_custom_http_server,
     run_custom_wifi,
     exit_to_console,
+
+    # ---------- Platform ----------
+    IS_MACOS,
 )
 
 from .view import draw_silo_hud, select_loop
@@ -56,6 +58,19 @@ from .widgets import wide_kerning, error_dialog, confirm_action, confirm_reboot_
 
 TITLE = "silo11writerdeck"
 
+def _columns(menu):
+    """Split (label, icon, value) rows into three parallel tuples (done once, at import)."""
+    labels, icons, values = zip(*menu)
+    return labels, icons, values
+
+def _run_menu(stdscr, title, labels, icons, actions):
+    """Shared submenu loop: pick an entry, run its action, stop on Back (None)."""
+    while True:
+        action = actions[select_loop(stdscr, title, labels, icons=icons, current=0)]
+        if action is None:
+            return
+        action(stdscr)
+
 # ======================================================================
 #  Writing Suite
 # ======================================================================
@@ -81,42 +96,29 @@ def launch_vim_action(stdscr):
 def launch_wordgrinder_action(stdscr):
     return run_wordgrinder(stdscr)
 
-import platform
-
-IS_MACOS = (platform.system() == "Darwin")
-IS_LINUX = (platform.system() == "Linux")
+if IS_MACOS:
+    _WRITING_MENU = (
+        ("Diary",        "✎", launch_diary_action),         # personal log / journal
+        ("Emacs",        "∞",  launch_emacs_action),        # infinite extensibility
+        ("Gedit",        "⌗", launch_gedit_action),         # GUI text editor
+        ("Nano",         "•",  launch_nano_action),         # quick edit
+        ("Obsidian",     "🜛", launch_obsidian_action),      # vault / alchemy symbol vibe
+        ("Vim",          "✍",  launch_vim_action),          # modal cycles / edit loop
+        ("WordGrinder",  "⌨", launch_wordgrinder_action),   # keyboard-driven writing
+        ("Back",         "◀",  None),
+    )
+else:
+    _WRITING_MENU = (
+        ("Emacs",        "∞",  launch_emacs_action),        # infinite extensibility
+        ("Nano",         "•",  launch_nano_action),         # quick edit
+        ("Vim",          "✍",  launch_vim_action),          # modal cycles / edit loop
+        ("WordGrinder",  "⌨", launch_wordgrinder_action),   # keyboard-driven writing
+        ("Back",         "◀",  None),
+    )
+_WRITING_LABELS, _WRITING_ICONS, _WRITING_ACTIONS = _columns(_WRITING_MENU)
 
 def writing_suite_menu(stdscr):
-    if IS_LINUX:
-        MENU = [
-          ("Emacs",        "∞",  launch_emacs_action),        # infinite extensibility
-          ("Nano",         "•",  launch_nano_action),         # quick edit
-          ("Vim",          "✍",  launch_vim_action),          # modal cycles / edit loop
-          ("WordGrinder",  "⌨", launch_wordgrinder_action),   # keyboard-driven writing
-          ("Back",         "◀",  None),
-        ]
-    elif IS_MACOS:
-        MENU = [
-          ("Diary",        "✎", launch_diary_action),         # personal log / journal
-          ("Emacs",        "∞",  launch_emacs_action),        # infinite extensibility
-          ("Gedit",        "⌗", launch_gedit_action),         # GUI text editor
-          ("Nano",         "•",  launch_nano_action),         # quick edit
-          ("Obsidian",     "🜛", launch_obsidian_action),      # vault / alchemy symbol vibe
-          ("Vim",          "✍",  launch_vim_action),          # modal cycles / edit loop
-          ("WordGrinder",  "⌨", launch_wordgrinder_action),   # keyboard-driven writing
-          ("Back",         "◀",  None),
-        ]
-        
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
-
-    while True:
-        choice = select_loop(stdscr, "WRITING SUITE", labels, icons=icons, current=0)
-        action = actions[choice]
-        if action is None:
-            return
-        action(stdscr)
+    _run_menu(stdscr, "WRITING SUITE", _WRITING_LABELS, _WRITING_ICONS, _WRITING_ACTIONS)
 
 LAST_USED_LAUNCHERS = {
     "diary": launch_diary_action,
@@ -156,21 +158,15 @@ def last_used_menu_item():
 def launch_export_files_action(stdscr):
     run_builtin_http_server(stdscr)
 
+_FILE_OPS_MENU = (
+    ("Export File(s)", "⇪", launch_export_files_action),
+    # ("Import File(s)", "down arrow", launch_import_files_action), # placeholder for future feature
+    ("Back",           "◀", None),
+)
+_FILE_OPS_LABELS, _FILE_OPS_ICONS, _FILE_OPS_ACTIONS = _columns(_FILE_OPS_MENU)
+
 def file_ops_menu(stdscr):
-    MENU = [
-        ("Export File(s)", "⇪", launch_export_files_action),
-        # ("Import File(s)", "down arrow", launch_import_files_action), # placeholder for future feature
-        ("Back",           "◀", None),
-    ]
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
-    while True:
-        choice = select_loop(stdscr, "FILE OPERATIONS", labels, icons=icons, current=0)
-        action = actions[choice]
-        if action is None:
-            return
-        action(stdscr)
+    _run_menu(stdscr, "FILE OPERATIONS", _FILE_OPS_LABELS, _FILE_OPS_ICONS, _FILE_OPS_ACTIONS)
  
 # ======================================================================
 #  Network Tools
@@ -182,44 +178,36 @@ def launch_bluetooth_action(stdscr):
 def launch_wifi_action(stdscr):
     run_nmtui_wifi(stdscr)
 
+_NETWORK_MENU = (
+    ("Bluetooth (ctl)", "☍", launch_bluetooth_action),
+    ("Wi-Fi (nmtui)",   "≋", launch_wifi_action),
+    ("Back",            "◀", None),
+)
+_NETWORK_LABELS, _NETWORK_ICONS, _NETWORK_ACTIONS = _columns(_NETWORK_MENU)
+
 def network_tools_menu(stdscr):
-    MENU = [
-        ("Bluetooth (ctl)", "☍", launch_bluetooth_action),
-        ("Wi-Fi (nmtui)",   "≋", launch_wifi_action),
-        ("Back",            "◀", None),
-    ]
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
-    while True:
-        choice = select_loop(stdscr, "NETWORK TOOLS", labels, icons=icons, current=0)
-        action = actions[choice]
-        if action is None:
-            return
-        action(stdscr)
+    _run_menu(stdscr, "NETWORK TOOLS", _NETWORK_LABELS, _NETWORK_ICONS, _NETWORK_ACTIONS)
 
 # ======================================================================
 #  Display & Themes
 # ======================================================================
 
+# Ordered by physical orientation rather than alphabetically.
+_ROTATION_MENU = (
+    ("0° (normal)",                    "⤾", 0),
+    ("90° (portrait clockwise)",       "⤾", 1),
+    ("180° (upside down)",             "⤾", 2),
+    ("270° (portrait counter-clockwise)","⤾", 3),
+    ("Back",                           "◀", None),
+)
+_ROTATION_LABELS, _ROTATION_ICONS, _ROTATION_VALUES = _columns(_ROTATION_MENU)
+
 def launch_rotation_action(stdscr):
     curses.curs_set(0)
     current_val = get_current_rotation()
     current_txt = rotation_label(current_val)
-    # Ordered by physical orientation rather than alphabetically.
-    MENU = [
-        ("0° (normal)",                    "⤾", 0),
-        ("90° (portrait clockwise)",       "⤾", 1),
-        ("180° (upside down)",             "⤾", 2),
-        ("270° (portrait counter-clockwise)","⤾", 3),
-        ("Back",                           "◀", None),
-    ]
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    values  = [val   for _, _, val in MENU]
-
-    pick = select_loop(stdscr, f"DISPLAY ROTATION (current = {current_txt})", labels, icons=icons, current=0)
-    label, val = labels[pick], values[pick]
+    pick = select_loop(stdscr, f"DISPLAY ROTATION (current = {current_txt})", _ROTATION_LABELS, icons=_ROTATION_ICONS, current=0)
+    label, val = _ROTATION_LABELS[pick], _ROTATION_VALUES[pick]
     if val is None:
         return
     try:
@@ -232,105 +220,89 @@ def launch_rotation_action(stdscr):
     except Exception as e:
         error_dialog(stdscr, f"Failed to set rotation: {e}", title="ROTATION ERROR")
 
+_DISPLAY_MENU = (
+    ("Screen Rotation", "⤾", launch_rotation_action),
+    ("Theme Switcher",  "◐", launch_theme_switcher_action),
+    ("Back",            "◀", None),
+)
+_DISPLAY_LABELS, _DISPLAY_ICONS, _DISPLAY_ACTIONS = _columns(_DISPLAY_MENU)
+
 def display_and_themes_menu(stdscr):
-    MENU = [
-        ("Screen Rotation", "⤾", launch_rotation_action),
-        ("Theme Switcher",  "◐", launch_theme_switcher_action),
-        ("Back",            "◀", None),
-    ]
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
-    while True:
-        choice = select_loop(stdscr, "DISPLAY & THEMES", labels, icons=icons, current=0)
-        action = actions[choice]
-        if action is None:
-            return
-        action(stdscr)
+    _run_menu(stdscr, "DISPLAY & THEMES", _DISPLAY_LABELS, _DISPLAY_ICONS, _DISPLAY_ACTIONS)
 
 # ======================================================================
 #  System Maintenance
 # ======================================================================
 
-def system_maintenance_menu(stdscr):
-    MENU = [
-        ("Health Check", "☑", launch_healthcheck_action),
-        ("Update",       "⟳", launch_update_action),
-        ("Uninstall",    "⊖", launch_uninstall_action),
-        ("Back",         "◀", None),
-    ]
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
-
-    while True:
-        choice = select_loop(stdscr, "SYSTEM MAINTENANCE", labels, icons=icons, current=0)
-        action = actions[choice]
-        label  = labels[choice]
-
-        if action is None:
-            return
+_MAINTENANCE_MENU = (
+    ("Health Check", "☑", launch_healthcheck_action),
+    ("Update",       "⟳", launch_update_action),
+    ("Uninstall",    "⊖", launch_uninstall_action),
+    ("Back",         "◀", None),
+)
+_MAINTENANCE_LABELS, _MAINTENANCE_ICONS, _MAINTENANCE_ACTIONS = _columns(_MAINTENANCE_MENU)
 
-        action(stdscr)
+def system_maintenance_menu(stdscr):
+    _run_menu(stdscr, "SYSTEM MAINTENANCE", _MAINTENANCE_LABELS, _MAINTENANCE_ICONS, _MAINTENANCE_ACTIONS)
 
 # ======================================================================
 #  Power Controls
 # ======================================================================
 
+# Small fixed pickers used by the power actions below
+_BT_POWER_LABELS,   _BT_POWER_ICONS   = ("Power On", "Power Off", "Back"), ("⏻", "⭘", "◀")
+_WIFI_POWER_LABELS, _WIFI_POWER_ICONS = ("Enable Wi-Fi", "Disable Wi-Fi", "Back"), ("⏻", "⭘", "◀")
+_RESTART_LABELS,    _RESTART_ICONS    = ("Restart now", "Back"), ("↻", "◀")
+_SHUTDOWN_LABELS,   _SHUTDOWN_ICONS   = ("Shut down", "Back"), ("⭘", "◀")
+
 # Local toggle actions for Bluetooth & Wi-Fi
 def toggle_bluetooth_action(stdscr):
-    pick = select_loop(stdscr, "BLUETOOTH POWER", ["Power On", "Power Off", "Back"], icons=["⏻", "⭘", "◀"])
+    pick = select_loop(stdscr, "BLUETOOTH POWER", _BT_POWER_LABELS, icons=_BT_POWER_ICONS)
     if pick == 0:
         draw_silo_hud(stdscr, "BLUETOOTH — POWERING ON…")
-        stdscr.refresh(); time.sleep(0.2)
+        stdscr.noutrefresh(); curses.doupdate()
         bt_power(True, stdscr=stdscr)
     elif pick == 1:
         draw_silo_hud(stdscr, "BLUETOOTH — POWERING OFF…")
-        stdscr.refresh(); time.sleep(0.2)
+        stdscr.noutrefresh(); curses.doupdate()
         bt_power(False, stdscr=stdscr)
 
 def toggle_wifi_action(stdscr):
-    pick = select_loop(stdscr, "WI-FI POWER", ["Enable Wi-Fi", "Disable Wi-Fi", "Back"], icons=["⏻", "⭘", "◀"])
+    pick = select_loop(stdscr, "WI-FI POWER", _WIFI_POWER_LABELS, icons=_WIFI_POWER_ICONS)
     if pick == 0:
         draw_silo_hud(stdscr, "WI-FI — ENABLING…")
-        stdscr.refresh(); time.sleep(0.2)
+        stdscr.noutrefresh(); curses.doupdate()
         wifi_power(True, stdscr=stdscr)
     elif pick == 1:
         draw_silo_hud(stdscr, "WI-FI — DISABLING…")
-        stdscr.refresh(); time.sleep(0.2)
+        stdscr.noutrefresh(); curses.doupdate()
         wifi_power(False, stdscr=stdscr)
 
 def restart_pi_action(stdscr):
-    pick = select_loop(stdscr, "CONFIRM RESTART", ["Restart now", "Back"], icons=["↻", "◀"])
+    pick = select_loop(stdscr, "CONFIRM RESTART", _RESTART_LABELS, icons=_RESTART_ICONS)
     if pick == 0:
         draw_silo_hud(stdscr, "RESTARTING — HOLD FAST…")
-        stdscr.refresh(); time.sleep(0.3)
+        stdscr.noutrefresh(); curses.doupdate()
         reboot_pi(stdscr=stdscr)
 
 def shutdown_pi_action(stdscr):
-    pick = select_loop(stdscr, "CONFIRM SHUTDOWN", ["Shut down", "Back"], icons=["⭘", "◀"])
+    pick = select_loop(stdscr, "CONFIRM SHUTDOWN", _SHUTDOWN_LABELS, icons=_SHUTDOWN_ICONS)
     if pick == 0:
         draw_silo_hud(stdscr, "POWERING DOWN — VENTS SEAL…")
-        stdscr.refresh(); time.sleep(0.3)
+        stdscr.noutrefresh(); curses.doupdate()
         shutdown_pi(stdscr=stdscr)
 
+_POWER_MENU = (
+    ("Bluetooth Power", "⌁", toggle_bluetooth_action),
+    ("Wi-Fi Power",     "↯", toggle_wifi_action),
+    ("Reboot",   "↻", restart_pi_action),
+    ("Shutdown", "⭘", shutdown_pi_action),
+    ("Back",     "◀", None),
+)
+_POWER_LABELS, _POWER_ICONS, _POWER_ACTIONS = _columns(_POWER_MENU)
+
 def power_controls_menu(stdscr):
-    MENU = [
-        ("Bluetooth Power", "⌁", toggle_bluetooth_action),
-        ("Wi-Fi Power",     "↯", toggle_wifi_action),
-        ("Reboot",   "↻", restart_pi_action),
-        ("Shutdown", "⭘", shutdown_pi_action),
-        ("Back",     "◀", None),
-    ]
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
-    while True:
-        choice = select_loop(stdscr, "POWER CONTROLS", labels, icons=icons, current=0)
-        action = actions[choice]
-        if action is None:
-            return
-        action(stdscr)
+    _run_menu(stdscr, "POWER CONTROLS", _POWER_LABELS, _POWER_ICONS, _POWER_ACTIONS)
 
 # ======================================================================
 #  Unauthorized Zone
@@ -349,25 +321,17 @@ def launch_exit_to_console_action(stdscr):
     curses.endwin()
     exit_to_console()
 
-def unauthorized_zone_menu(stdscr):
-    MENU = [
-        ("Salvage Peripherals (custom Bluetooth)",     "☍", launch_custom_bluetooth_action),
-        ("Transmit to the Wastes (custom http_server)","▤", launch_run_custom_http_server_action),
-        ("Connect to the Wastes (custom Wi-Fi)",       "≋", launch_run_custom_wifi_action),
-        ("Exit to Console",                            "⚙", launch_exit_to_console_action), # stays last in list
-        ("Back",                                       "◀", None),
-    ]
-
-    labels  = [label for label, _, _ in MENU]
-    icons   = [icon  for _, icon, _ in MENU]
-    actions = [func  for _, _, func in MENU]
+_UNAUTHORIZED_MENU = (
+    ("Salvage Peripherals (custom Bluetooth)",     "☍", launch_custom_bluetooth_action),
+    ("Transmit to the Wastes (custom http_server)","▤", launch_run_custom_http_server_action),
+    ("Connect to the Wastes (custom Wi-Fi)",       "≋", launch_run_custom_wifi_action),
+    ("Exit to Console",                            "⚙", launch_exit_to_console_action), # stays last in list
+    ("Back",                                       "◀", None),
+)
+_UNAUTHORIZED_LABELS, _UNAUTHORIZED_ICONS, _UNAUTHORIZED_ACTIONS = _columns(_UNAUTHORIZED_MENU)
 
-    while True:
-        choice = select_loop(stdscr, "UNAUTHORIZED ZONE", labels, icons=icons, current=0)
-        action = actions[choice]
-        if action is None:
-            return
-        action(stdscr)
+def unauthorized_zone_menu(stdscr):
+    _run_menu(stdscr, "UNAUTHORIZED ZONE", _UNAUTHORIZED_LABELS, _UNAUTHORIZED_ICONS, _UNAUTHORIZED_ACTIONS)
 
 # ======================================================================
 #  Main Menu (needs to stay down here to call the methods)
@@ -396,10 +360,8 @@ def main_menu_loop(stdscr):
     curses.curs_set(0)
     init_theme()
     current = 0
-    MAIN_MENU = build_main_menu()
-    labels  = [label for label, _, _ in MAIN_MENU]
-    icons   = [icon  for _, icon, _ in MAIN_MENU]
-    actions = [func  for _, _, func in MAIN_MENU]
+    last_id = get_last_used()
+    labels, icons, actions = _columns(build_main_menu())
 
     while True:
         choice = select_loop(
@@ -411,11 +373,11 @@ def main_menu_loop(stdscr):
         )
         actions[choice](stdscr)
         current = choice
-        # Rebuild to surface updated "Last Used" on return
-        MAIN_MENU = build_main_menu()
-        labels  = [label for label, _, _ in MAIN_MENU]
-        icons   = [icon  for _, icon, _ in MAIN_MENU]
-        actions = [func  for _, _, func in MAIN_MENU]
+        # Rebuild only when the "Last Used" app actually changed
+        lu_id = get_last_used()
+        if lu_id != last_id:
+            last_id = lu_id
+            labels, icons, actions = _columns(build_main_menu())
 
 def main(stdscr):
     try:
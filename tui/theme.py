@@ -10,13 +10,14 @@
 import curses
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # ════════════════════════════════════════════════════════════════════════════
 # [CONFIG] Data (no curses, no side-effects)
 # ════════════════════════════════════════════════════════════════════════════
 
-# Stable color indices (ncurses 8-color baseline)
-COLOR_BY_NAME = {
+# Stable color indices (ncurses 8-color baseline); read-only
+COLOR_BY_NAME = MappingProxyType({
     "black":   getattr(curses, "COLOR_BLACK",   0),
     "red":     getattr(curses, "COLOR_RED",     1),
     "green":   getattr(curses, "COLOR_GREEN",   2),
@@ -25,7 +26,7 @@ COLOR_BY_NAME = {
     "magenta": getattr(curses, "COLOR_MAGENTA", 5),
     "cyan":    getattr(curses, "COLOR_CYAN",    6),
     "white":   getattr(curses, "COLOR_WHITE",   7),
-}
+})
 
 # Logical slots (semantics)
 # - Banner (big stripe): banner_bg, banner_fg  (title text on the stripe)
@@ -123,8 +124,10 @@ BOLT   = "•"
 RIVET  = "⟆"
 SLASH  = "/"
 BSLASH = "\\"
-HAZ_CHARS = [SLASH, BSLASH, "|", SLASH + BSLASH, BSLASH + SLASH]
-PATINA = ["·", "·", "·", "·", "·", " ", " ", " "]
+HAZ_CHARS = (SLASH, BSLASH, "|", SLASH + BSLASH, BSLASH + SLASH)
+# Patina cell glyphs and their relative weights (5 dots : 3 blanks)
+PATINA_CHARS   = ("·", " ")
+PATINA_WEIGHTS = (5, 3)
 
 # Env-driven knobs (visual noise intensities)
 def _int_env(name: str, default: int) -> int:
@@ -160,7 +163,7 @@ HEADER_GUARD_ROW = 1
 
 # XDG-config for persisted theme selection (env still wins)
 APP_NAME = "silo11writerdeck"
-XDG_CONFIG_HOME = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
+XDG_CONFIG_HOME = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
 CFG_DIR = XDG_CONFIG_HOME / APP_NAME
 THEME_FILE = CFG_DIR / "theme"
 
@@ -169,19 +172,17 @@ THEME_FILE = CFG_DIR / "theme"
 # ════════════════════════════════════════════════════════════════════════════
 
 def _color_from_env(name: str, default_idx: int) -> int:
-    val = os.environ.get(name, "").strip().lower()
-    if not val:
+    val = os.environ.get(name)
+    if not val:  # unset/empty is the common case: skip the string work
         return default_idx
-    return COLOR_BY_NAME.get(val, default_idx)
+    return COLOR_BY_NAME.get(val.strip().lower(), default_idx)
 
 def _read_persisted_theme() -> str | None:
+    # EAFP: a missing file is just an OSError, no separate exists() stat
     try:
-        if THEME_FILE.exists():
-            name = THEME_FILE.read_text(encoding="utf-8").strip().lower()
-            return name or None
-    except Exception:
-        pass
-    return None
+        return THEME_FILE.read_text(encoding="utf-8").strip().lower() or None
+    except (OSError, UnicodeDecodeError):
+        return None
 
 def _resolve_theme_name() -> str:
     # 1) explicit env overrides persisted choice
@@ -305,6 +306,24 @@ def _register_pairs(C: dict):
     # Banner title text on banner background
     _init_pair(PAIR_HEADER,    C["banner_fg"],    C["banner_bg"])
 
+# Ready-made attributes for the per-frame draw paths (color_pair needs curses up,
+# so these are filled in by init_theme(); read them as theme.ATTR_* at draw time)
+ATTR_HIGHLIGHT_BOLD = ATTR_BODY = ATTR_LABEL = ATTR_LABEL_BOLD = 0
+ATTR_HINTS_BOLD = ATTR_OK_BOLD = ATTR_DANGER_BOLD = ATTR_RUST_BOLD = 0
+
+def _register_attrs():
+    global ATTR_HIGHLIGHT_BOLD, ATTR_BODY, ATTR_LABEL, ATTR_LABEL_BOLD
+    global ATTR_HINTS_BOLD, ATTR_OK_BOLD, ATTR_DANGER_BOLD, ATTR_RUST_BOLD
+    bold = curses.A_BOLD
+    ATTR_HIGHLIGHT_BOLD = curses.color_pair(PAIR_HIGHLIGHT) | bold
+    ATTR_BODY           = curses.color_pair(PAIR_BODY)
+    ATTR_LABEL          = curses.color_pair(PAIR_LABEL)
+    ATTR_LABEL_BOLD     = ATTR_LABEL | bold
+    ATTR_HINTS_BOLD     = curses.color_pair(PAIR_HINTS) | bold
+    ATTR_OK_BOLD        = curses.color_pair(PAIR_OK) | bold
+    ATTR_DANGER_BOLD    = curses.color_pair(PAIR_DANGER) | bold
+    ATTR_RUST_BOLD      = curses.color_pair(PAIR_RUST) | bold
+
 # ════════════════════════════════════════════════════════════════════════════
 # [WIRING] Composition (single public entry point)
 # ════════════════════════════════════════════════════════════════════════════
@@ -326,5 +345,6 @@ def init_theme(theme_name: str | None = None) -> dict:
 
     numeric_palette = _resolve_palette_from_preset()
     _register_pairs(numeric_palette)
+    _register_attrs()
 
     return {"name": get_theme(), "palette": numeric_palette}
@@ -10,10 +10,7 @@ from __future__ import annotations
 
 import curses
 
-from .theme import (
-    init_theme,  # wiring
-    PAIR_HIGHLIGHT, PAIR_BODY,
-)
+from . import theme
 from .layout import (
     draw_patina, draw_static, draw_riveted_frame,
     draw_hazard_header, draw_bottom_bolt_rail,
@@ -21,30 +18,41 @@ from .layout import (
 )
 from .widgets import (
     wide_kerning,
+    NAV_DELTA, ENTER_KEYS,
     draw_footer_integrated_mainmenu,
     set_hud_renderer,  # register this module as the HUD provider
 )
 
 DEFAULT_HINTS = " Navigation = ↑ ↓  Select = Enter "
 
-# Theme init happens lazily after curses is ready.
-_THEME_READY = False
+# Patina/static noise is rendered once per screen size into an off-screen pad
+_NOISE_PAD = None
+_NOISE_DIMS: tuple[int, int] | None = None
+
+def _draw_noise(stdscr) -> None:
+    """Overlay the cached noise layer; regenerate it only when the screen size changes."""
+    global _NOISE_PAD, _NOISE_DIMS
+    h, w = stdscr.getmaxyx()
+    try:
+        if _NOISE_DIMS != (h, w):
+            pad = curses.newpad(h, w)
+            draw_patina(pad)
+            draw_static(pad)
+            _NOISE_PAD, _NOISE_DIMS = pad, (h, w)
+        _NOISE_PAD.overlay(stdscr)
+    except curses.error:
+        draw_patina(stdscr)
+        draw_static(stdscr)
 
 # ----- HUD (single source of truth) -----
 def draw_silo_hud(stdscr, title: str, hints: str = DEFAULT_HINTS):
     """
     HUD = patina → static → frame → header/banner → bottom bolt rail → integrated footer.
+    Colors come from init_theme(), called once by main_menu_loop after curses starts.
     """
-    global _THEME_READY
-    if not _THEME_READY:
-        # Now curses has been initialized by curses.wrapper(...), it's safe to init colors.
-        init_theme()
-        _THEME_READY = True
-
     title = wide_kerning(title)
     stdscr.clear()
-    draw_patina(stdscr)
-    draw_static(stdscr)
+    _draw_noise(stdscr)
     draw_riveted_frame(stdscr)
     draw_hazard_header(stdscr, title)          # uses PAIR_HAZARD (edges) + PAIR_HEADER (banner text)
     draw_bottom_bolt_rail(stdscr)
@@ -68,6 +76,20 @@ def _truncate_for_inner(text: str, w: int, margin: int = 1) -> str:
 
 
 # ----- Select screen -----
+def _drain_resize_burst(stdscr, quiet_ms: int = 30) -> None:
+    """Swallow back-to-back KEY_RESIZE events so a drag-resize costs one HUD repaint."""
+    stdscr.timeout(quiet_ms)
+    try:
+        while True:
+            ch = stdscr.getch()
+            if ch == -1:
+                return
+            if ch != curses.KEY_RESIZE:
+                curses.ungetch(ch)  # real input arrived: keep it for the caller
+                return
+    finally:
+        stdscr.timeout(-1)
+
 def select_loop(
     stdscr,
     title: str,
@@ -83,31 +105,42 @@ def select_loop(
     if icons is None:
         icons = ["■"] * len(labels)
 
+    # Row strings are fixed for this menu; only the width clip depends on the screen size.
+    pretty_raw = [
+        f" {icons[i] if i < len(icons) else '■'}  {wide_kerning(label, 1)} "
+        for i, label in enumerate(labels)
+    ]
+
+    def _draw_row(i: int) -> None:
+        attr = theme.ATTR_HIGHLIGHT_BOLD if i == current else theme.ATTR_BODY
+        draw_centered(stdscr, top + i * 2, pretty[i], attr)
+
+    # Full HUD only on entry and resize; arrow keys repaint just the two rows that changed.
+    full = True
+    prev = current
     while True:
-        draw_silo_hud(stdscr, title, hints=hints)
-
-        h, w = stdscr.getmaxyx()
-        top = max(3, (h // 2) - len(labels))
-
-        for i, label in enumerate(labels):
-            y = top + i * 2
-            icon = icons[i] if i < len(icons) else "■"
-            pretty_raw = f" {icon}  {wide_kerning(label, 1)} "
-            pretty = _truncate_for_inner(pretty_raw, w, margin=1)
-            attr = (
-                curses.color_pair(PAIR_HIGHLIGHT) | curses.A_BOLD
-                if i == current else curses.color_pair(PAIR_BODY)
-            )
-            draw_centered(stdscr, y, pretty, attr)
-
-        stdscr.refresh()
+        if full:
+            draw_silo_hud(stdscr, title, hints=hints)
+            h, w = stdscr.getmaxyx()
+            top = max(3, (h // 2) - len(labels))
+            pretty = [_truncate_for_inner(p, w, margin=1) for p in pretty_raw]
+            for i in range(len(labels)):
+                _draw_row(i)
+            full = False
+        elif prev != current:
+            _draw_row(prev)
+            _draw_row(current)
+
+        stdscr.noutrefresh()
+        curses.doupdate()
         ch = stdscr.getch()
-        if ch in (curses.KEY_UP, ord('k')):
-            current = (current - 1) % len(labels)
-        elif ch in (curses.KEY_DOWN, ord('j')):
-            current = (current + 1) % len(labels)
-        elif ch in (curses.KEY_ENTER, 10, 13):
+        prev = current
+        delta = NAV_DELTA.get(ch)
+        if delta is not None:
+            current = (current + delta) % len(labels)
+        elif ch in ENTER_KEYS:
             return current
-        else:
-            # Esc and others are ignored by design
-            pass
+        elif ch == curses.KEY_RESIZE:
+            _drain_resize_burst(stdscr)
+            full = True
+        # Esc and others are ignored by design
@@ -10,18 +10,23 @@ from __future__ import annotations
 import curses
 import os
 import random
+from functools import lru_cache
 from typing import Callable, Optional
 
+from . import theme
 from .theme import (
-    PAIR_HIGHLIGHT, PAIR_RUST, PAIR_BODY, PAIR_DANGER,
-    PAIR_OK, PAIR_WARN, PAIR_LABEL, PAIR_HINTS,
+    PAIR_DANGER, PAIR_OK, PAIR_WARN,
 )
 from .layout import (
-    safe_addnstr, draw_centered, draw_bottom_bolt_rail,
+    draw_centered, draw_bottom_bolt_rail,
 )
 
 DEFAULT_HINTS = " Navigation = ↑ ↓  Select = Enter "
 
+# Key maps shared by the selector loops (↑/k and ↓/j move, Enter picks)
+NAV_DELTA = {curses.KEY_UP: -1, ord('k'): -1, curses.KEY_DOWN: 1, ord('j'): 1}
+ENTER_KEYS = frozenset((curses.KEY_ENTER, 10, 13))
+
 # ----- HUD injection point (required) -----
 _HUD_FN: Optional[Callable[[curses.window, str, str], None]] = None
 
@@ -38,9 +43,10 @@ def _hud(stdscr, title: str, hints: str = DEFAULT_HINTS):
 
 
 # ----- Helpers -----
+@lru_cache(maxsize=128)
 def wide_kerning(text: str, spaces: int = 1) -> str:
-    spacer = " " * spaces
-    return spacer.join(list(text or ""))
+    # Titles/labels are a small fixed set, redrawn every keypress — memoize
+    return (" " * spaces).join(text or "")
 
 
 # ----- Status plumbing (env or random) -----
@@ -89,15 +95,18 @@ def set_status_for_session(system_tuple, seals_tuple, air_tuple):
 
 
 # ----- Footer (main menu) -----
-def draw_footer_integrated_mainmenu(stdscr, hints: str):
-    (sys_name, sys_pair), (seal_name, seal_pair), (air_name, air_pair) = get_status()
+FOOTER_LABELS = ("SYSTEM: ", "SEALS: ", "AIR: ")
+FOOTER_GAP = "   "
 
-    h, w = stdscr.getmaxyx()
-    y = h - 1
-    if y < 1:
-        return
+# (w, status, hints) -> ((x, text, n, attr), ...); changes only on resize or status/hint change.
+# Segments are pre-clipped to the row (never the last column), so they can be written unchecked.
+_FOOTER_LAYOUT: dict[tuple, tuple[tuple[int, str, int, int], ...]] = {}
 
-    draw_bottom_bolt_rail(stdscr)
+def _footer_segments(w: int, status, hints: str) -> tuple[tuple[int, str, int, int], ...]:
+    key = (w, status, hints)
+    segs = _FOOTER_LAYOUT.get(key)
+    if segs is not None:
+        return segs
 
     inner_w = max(0, w - 2)
     left_start = 1
@@ -108,37 +117,54 @@ def draw_footer_integrated_mainmenu(stdscr, hints: str):
     right_q_w = max(1, inner_w - ((inner_w * 3) // 4))
     right_q_center = right_q_start + (right_q_w // 2)
 
-    gap = "   "
-    L1, L2, L3 = "SYSTEM: ", "SEALS: ", "AIR: "
-    left_len = (
-        len(L1) + len(sys_name) + len(gap) +
-        len(L2) + len(seal_name) + len(gap) +
-        len(L3) + len(air_name)
-    )
+    parts = []
+    for i, (label, (name, pair)) in enumerate(zip(FOOTER_LABELS, status)):
+        if i:
+            parts.append((FOOTER_GAP, theme.ATTR_BODY))
+        parts.append((label, theme.ATTR_LABEL))
+        parts.append((name, curses.color_pair(pair) | curses.A_BOLD))
 
-    left_x = max(
+    left_len = sum(len(text) for text, _ in parts)
+    x = max(
         left_start,
         min(left_start + left_w - left_len, left_center - (left_len // 2))
     )
+    out = []
+    for text, attr in parts:
+        out.append((x, text, attr))
+        x += len(text)
 
-    x = left_x
-    safe_addnstr(stdscr, y, x, L1, None, curses.color_pair(PAIR_LABEL)); x += len(L1)
-    safe_addnstr(stdscr, y, x, sys_name, None, curses.color_pair(sys_pair) | curses.A_BOLD); x += len(sys_name)
-    safe_addnstr(stdscr, y, x, gap, None, curses.color_pair(PAIR_BODY)); x += len(gap)
-
-    safe_addnstr(stdscr, y, x, L2, None, curses.color_pair(PAIR_LABEL)); x += len(L2)
-    safe_addnstr(stdscr, y, x, seal_name, None, curses.color_pair(seal_pair) | curses.A_BOLD); x += len(seal_name)
-    safe_addnstr(stdscr, y, x, gap, None, curses.color_pair(PAIR_BODY)); x += len(gap)
-
-    safe_addnstr(stdscr, y, x, L3, None, curses.color_pair(PAIR_LABEL)); x += len(L3)
-    safe_addnstr(stdscr, y, x, air_name, None, curses.color_pair(air_pair) | curses.A_BOLD)
-
-    hint_len = len(hints or "")
+    hint_len = len(hints)
     hx = max(
         right_q_start,
         min(right_q_start + right_q_w - hint_len, right_q_center - (hint_len // 2))
     )
-    safe_addnstr(stdscr, y, hx, hints or "", None, curses.color_pair(PAIR_HINTS) | curses.A_BOLD)
+    out.append((hx, hints, theme.ATTR_HINTS_BOLD))
+
+    segs = _FOOTER_LAYOUT[key] = tuple(
+        (x, text, min(len(text), w - 1 - x), attr)
+        for x, text, attr in out
+        if text and 0 <= x < w - 1
+    )
+    return segs
+
+def _write_segments(win, y: int, segments) -> None:
+    """Write pre-clipped (x, text, n, attr) segments on one row under a single guard."""
+    try:
+        for x, text, n, attr in segments:
+            win.addnstr(y, x, text, n, attr)
+    except curses.error:
+        pass
+
+def draw_footer_integrated_mainmenu(stdscr, hints: str):
+    h, w = stdscr.getmaxyx()
+    y = h - 1
+    if y < 1:
+        return
+
+    draw_bottom_bolt_rail(stdscr)
+
+    _write_segments(stdscr, y, _footer_segments(w, get_status(), hints or ""))
 
 
 # ----- Dialogs (use injected HUD) -----
@@ -148,9 +174,10 @@ def confirm_action(stdscr, action_name: str) -> bool:
         stdscr,
         4,
         wide_kerning(f"Proceed to {action_name}?  (y/n)", 1),
-        curses.color_pair(PAIR_RUST) | curses.A_BOLD,
+        theme.ATTR_RUST_BOLD,
     )
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    curses.doupdate()
 
     while True:
         key = stdscr.getch()
@@ -164,10 +191,11 @@ def success_dialog(stdscr, message: str, *, title: str = "FAULT // OPERATION"):
     _hud(stdscr, title, hints=DEFAULT_HINTS)
 
     h, w = stdscr.getmaxyx()
-    draw_centered(stdscr, max(5, h // 2 - 2), "Success", curses.color_pair(PAIR_OK) | curses.A_BOLD)
-    draw_centered(stdscr, max(7, h // 2), (message or "")[: max(0, w - 4)], curses.color_pair(PAIR_BODY))
-    draw_centered(stdscr, max(9, h // 2 + 2), "Press any key…", curses.color_pair(PAIR_HINTS) | curses.A_BOLD)
-    stdscr.refresh()
+    draw_centered(stdscr, max(5, h // 2 - 2), "Success", theme.ATTR_OK_BOLD)
+    draw_centered(stdscr, max(7, h // 2), (message or "")[: max(0, w - 4)], theme.ATTR_BODY)
+    draw_centered(stdscr, max(9, h // 2 + 2), "Press any key…", theme.ATTR_HINTS_BOLD)
+    stdscr.noutrefresh()
+    curses.doupdate()
     stdscr.getch()
 
 def error_dialog(stdscr, message: str, *, title: str = "FAULT // OPERATION"):
@@ -175,10 +203,11 @@ def error_dialog(stdscr, message: str, *, title: str = "FAULT // OPERATION"):
     _hud(stdscr, title, hints=DEFAULT_HINTS)
 
     h, w = stdscr.getmaxyx()
-    draw_centered(stdscr, max(5, h // 2 - 2), "Error", curses.color_pair(PAIR_DANGER) | curses.A_BOLD)
-    draw_centered(stdscr, max(7, h // 2), (message or "")[: max(0, w - 4)], curses.color_pair(PAIR_BODY))
-    draw_centered(stdscr, max(9, h // 2 + 2), "Press any key…", curses.color_pair(PAIR_HINTS) | curses.A_BOLD)
-    stdscr.refresh()
+    draw_centered(stdscr, max(5, h // 2 - 2), "Error", theme.ATTR_DANGER_BOLD)
+    draw_centered(stdscr, max(7, h // 2), (message or "")[: max(0, w - 4)], theme.ATTR_BODY)
+    draw_centered(stdscr, max(9, h // 2 + 2), "Press any key…", theme.ATTR_HINTS_BOLD)
+    stdscr.noutrefresh()
+    curses.doupdate()
     stdscr.getch()
 
 def confirm_reboot_dialog(stdscr, new_label: str) -> int:
@@ -193,25 +222,25 @@ def confirm_reboot_dialog(stdscr, new_label: str) -> int:
         _hud(stdscr, "DISPLAY // ROTATION", hints=DEFAULT_HINTS)
 
         msg = f"Rotation set to {new_label}. Reboot now to apply?"
-        draw_centered(stdscr, 5, msg, curses.color_pair(PAIR_LABEL) | curses.A_BOLD)
+        draw_centered(stdscr, 5, msg, theme.ATTR_LABEL_BOLD)
 
         h, _ = stdscr.getmaxyx()
         top = max(8, h // 2 - len(choices))
         for i, c in enumerate(choices):
             y = top + i * 2
-            attr = curses.color_pair(PAIR_HIGHLIGHT) | curses.A_BOLD if i == idx else curses.color_pair(PAIR_BODY)
+            attr = theme.ATTR_HIGHLIGHT_BOLD if i == idx else theme.ATTR_BODY
             draw_centered(stdscr, y, f" {wide_kerning(c, 1)} ", attr)
 
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
 
         ch = stdscr.getch()
-        if ch in (curses.KEY_UP, ord('k')):
-            idx = (idx - 1) % len(choices)
-        elif ch in (curses.KEY_DOWN, ord('j')):
-            idx = (idx + 1) % len(choices)
-        elif ch in (27,):  # ESC
+        delta = NAV_DELTA.get(ch)
+        if delta is not None:
+            idx = (idx + delta) % len(choices)
+        elif ch == 27:  # ESC
             return 1
-        elif ch in (curses.KEY_ENTER, 10, 13):
+        elif ch in ENTER_KEYS:
             return idx
 
 
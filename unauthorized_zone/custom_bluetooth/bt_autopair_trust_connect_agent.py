@@ -8,13 +8,14 @@ Bluetooth Auto-Pair, Trust & Connect Agent (silo11writerdeck)
 
 from __future__ import annotations
 
-import argparse
+import atexit
+import functools
+import gc
 import os
 import re
-import shutil
-import subprocess
 import sys
 import time
+from types import SimpleNamespace
 
 try:
     import dbus
@@ -27,112 +28,224 @@ except Exception as e:  # pragma: no cover (environmental)
 
 AGENT_PATH = "/test/agent"
 
+BLUEZ = "org.bluez"
+ADAPTER_PATH = "/org/bluez/hci0"
+ADAPTER_IFACE = "org.bluez.Adapter1"
+DEVICE_IFACE = "org.bluez.Device1"
+PROPS_IFACE = "org.freedesktop.DBus.Properties"
+LAST_MAC_FILE = "/tmp/last_bluetooth_mac"
+BLUEZ_TIMEOUT = 5.0  # seconds per D-Bus call (same budget the bluetoothctl calls had)
+
+# Fixed introspection reply, mirroring the method decorators below (built once, not per probe)
+_AGENT_INTROSPECT_XML = """<!DOCTYPE node PUBLIC "-//freedesktop//DTD D-BUS Object Introspection 1.0//EN"
+ "http://www.freedesktop.org/standards/dbus/1.0/introspect.dtd">
+<node>
+  <interface name="org.freedesktop.DBus.Introspectable">
+    <method name="Introspect"><arg direction="out" type="s"/></method>
+  </interface>
+  <interface name="org.bluez.Agent1">
+    <method name="Release"/>
+    <method name="AuthorizeService"><arg direction="in" type="o"/><arg direction="in" type="s"/></method>
+    <method name="RequestPinCode"><arg direction="in" type="o"/><arg direction="out" type="s"/></method>
+    <method name="RequestPasskey"><arg direction="in" type="o"/><arg direction="out" type="u"/></method>
+    <method name="DisplayPasskey"><arg direction="in" type="o"/><arg direction="in" type="s"/></method>
+    <method name="RequestConfirmation"><arg direction="in" type="o"/><arg direction="in" type="s"/></method>
+    <method name="RequestAuthorization"><arg direction="in" type="o"/></method>
+    <method name="Cancel"><arg direction="in" type="o"/></method>
+  </interface>
+</node>
+"""
 
-def parse_arguments() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="BlueZ auto-pair, trust & connect agent (NoInputNoOutput)"
-    )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print intended bluetoothctl commands without executing them",
-    )
-    parser.add_argument(
-        "--log",
-        default="/tmp/bt-autopair-trust-connect.log",
-        help="Path to a log file (default: /tmp/bt-autopair-trust-connect.log)",
-    )
-    parser.add_argument(
-        "--wait-retries",
-        type=int,
-        default=10,
-        help="Max attempts to wait for adapter Powered: yes (default: 10)",
-    )
-    parser.add_argument(
-        "--wait-delay",
-        type=float,
-        default=1.0,
-        help="Delay (s) between wait attempts (default: 1.0)",
-    )
-    parser.add_argument(
-        "--no-post-connect-knobs",
-        action="store_true",
-        help="Do NOT disable discoverable/pairable/scan after connect",
+_MAC_RE = re.compile(r"dev_([0-9A-F_]{17})$", re.IGNORECASE)
+
+
+USAGE = """\
+usage: bt_autopair_trust_connect_agent.py [-h] [--dry-run] [--log LOG]
+       [--wait-retries N] [--wait-delay SECONDS] [--no-post-connect-knobs]
+
+BlueZ auto-pair, trust & connect agent (NoInputNoOutput)
+
+  --dry-run                Log intended BlueZ calls without executing them
+  --log LOG                Path to a log file (default: /tmp/bt-autopair-trust-connect.log)
+  --wait-retries N         Wait budget for adapter Powered: yes, in units of --wait-delay (default: 10)
+  --wait-delay SECONDS     Seconds per --wait-retries unit (default: 1.0)
+  --no-post-connect-knobs  Do NOT disable discoverable/pairable/scan after connect
+"""
+
+
+def parse_arguments(argv: list[str] | None = None) -> SimpleNamespace:
+    """Tiny argv walker (no argparse import on a once-per-boot daemon). Accepts --opt VALUE and --opt=VALUE."""
+    args = SimpleNamespace(
+        dry_run=False,
+        log="/tmp/bt-autopair-trust-connect.log",
+        wait_retries=10,
+        wait_delay=1.0,
+        no_post_connect_knobs=False,
     )
-    return parser.parse_args()
+    valued = {"--log": ("log", str), "--wait-retries": ("wait_retries", int), "--wait-delay": ("wait_delay", float)}
+    flags = {"--dry-run": "dry_run", "--no-post-connect-knobs": "no_post_connect_knobs"}
+
+    def fail(msg: str):
+        sys.stderr.write(USAGE + f"error: {msg}\n")
+        sys.exit(2)
+
+    rest = list(sys.argv[1:] if argv is None else argv)
+    while rest:
+        tok = rest.pop(0)
+        opt, eq, val = tok.partition("=")
+        if tok in ("-h", "--help"):
+            sys.stdout.write(USAGE)
+            sys.exit(0)
+        elif tok in flags:
+            setattr(args, flags[tok], True)
+        elif opt in valued:
+            if not eq:
+                if not rest:
+                    fail(f"argument {opt}: expected one argument")
+                val = rest.pop(0)
+            name, conv = valued[opt]
+            try:
+                setattr(args, name, conv(val))
+            except ValueError:
+                fail(f"argument {opt}: invalid {conv.__name__} value: {val!r}")
+        else:
+            fail(f"unrecognized arguments: {tok}")
+    return args
 
 
-def have_bluetoothctl() -> bool:
-    return shutil.which("bluetoothctl") is not None
+@functools.lru_cache(maxsize=64)
+def extract_mac(device_path: str) -> str | None:
+    """
+    /org/bluez/hci0/dev_XX_XX_XX_XX_XX_XX  ->  XX:XX:XX:XX:XX:XX
+    Case-insensitive; underscores are converted to colons.
+    Cached: BlueZ calls several agent methods for the same device while pairing.
+    """
+    m = _MAC_RE.search(device_path)
+    if not m:
+        return None
+    return m.group(1).replace("_", ":").upper()
 
 
 class Agent(dbus.service.Object):
     def __init__(self, bus, path, *, dry_run: bool = False, logfile: str | None = None, knobs: bool = True):
         super().__init__(bus, path)
+        self.bus = bus
         self.dry_run = dry_run
-        self.logfile = logfile
+        # One buffered handle for the agent's lifetime; flushed ~100 ms after a burst
+        self._logfh = None
+        self._flush_source = None
+        self._ts_sec = -1    # log timestamp is formatted at most once per second
+        self._ts_str = ""
+        if logfile:
+            try:
+                self._logfh = open(logfile, "a", buffering=1 << 14)
+                atexit.register(self._close_log)
+            except OSError as e:
+                print(f"[LOGGING ERROR] {e}")
         self.post_connect_knobs = knobs  # controls discoverable/pairable/scan toggles
+        self._last_written_mac = None
+        # Adapter proxies are built once; follow_name_owner_changes survives a bluetoothd restart
+        adapter = bus.get_object(BLUEZ, ADAPTER_PATH, introspect=False, follow_name_owner_changes=True)
+        self.adapter = dbus.Interface(adapter, ADAPTER_IFACE)
+        self.adapter_props = dbus.Interface(adapter, PROPS_IFACE)
 
     # ---------- logging ----------
     def log(self, msg: str) -> None:
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        line = f"[{ts}] {msg}"
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        line = f"[{self._ts_str}] {msg}"
         print(line)
-        if self.logfile:
-            try:
-                with open(self.logfile, "a") as f:
-                    f.write(line + "\n")
-            except Exception as e:
-                print(f"[LOGGING ERROR] {e}")
+        if self._logfh is None:
+            return
+        try:
+            self._logfh.write(line + "\n")
+        except Exception as e:
+            print(f"[LOGGING ERROR] {e}")
+            return
+        if self._flush_source is None:
+            self._flush_source = GLib.timeout_add(100, self._flush_log)
+
+    def _flush_log(self) -> bool:
+        self._flush_source = None
+        if self._logfh is None:
+            return False
+        try:
+            self._logfh.flush()
+        except Exception as e:
+            print(f"[LOGGING ERROR] {e}")
+        return False  # one-shot; the next log() re-arms it
+
+    def _close_log(self) -> None:
+        if self._flush_source is not None:
+            GLib.source_remove(self._flush_source)
+            self._flush_source = None
+        try:
+            self._logfh.close()
+        except Exception:
+            pass
 
     # ---------- helpers ----------
-    def extract_mac(self, device_path: str) -> str | None:
+    def call_bluez(self, label: str, method, *args, on_ok=None, on_err=None) -> None:
         """
-        /org/bluez/hci0/dev_XX_XX_XX_XX_XX_XX  ->  XX:XX:XX:XX:XX:XX
-        Case-insensitive; underscores are converted to colons.
+        Fire one BlueZ D-Bus method asynchronously and return at once, so the
+        main loop keeps dispatching while BlueZ works. Errors are logged;
+        on_ok (called with the reply values) / on_err (no arguments) chain
+        the next step.
         """
-        m = re.search(r"dev_([0-9a-fA-F_]+)$", device_path)
-        if not m:
-            return None
-        return m.group(1).replace("_", ":").upper()
+        self.log(f"[dbus] {label}")
 
-    def run_bt(self, *args: str) -> tuple[int, str]:
-        """
-        Run `bluetoothctl <args...>` with a short timeout.
-        Logs the command and output. Ignores nonzero exits (returns code + output).
-        Respects --dry-run.
-        """
-        cmd = ["bluetoothctl", *args]
-        self.log(f"$ {' '.join(cmd)}")
-        if self.dry_run:
-            self.log("[DRY RUN] Skipping execution")
-            return 0, ""
+        def _ok(*reply):
+            if on_ok:
+                on_ok(*reply)
 
+        def _err(e):
+            self.log(f"[dbus] ERROR: {label}: {e}")
+            if on_err:
+                on_err()
+
+        method(*args, timeout=BLUEZ_TIMEOUT, reply_handler=_ok, error_handler=_err)
+
+    def _on_connect_ok(self) -> None:
+        # Only apply “knobs” after a successful CONNECT
+        if not self.post_connect_knobs:
+            return
+        self.log("Connect OK -> turning discoverable/pairable/scan OFF")
+        self.call_bluez("Adapter1.Discoverable = false", self.adapter_props.Set,
+                        ADAPTER_IFACE, "Discoverable", dbus.Boolean(False))
+        self.call_bluez("Adapter1.Pairable = false", self.adapter_props.Set,
+                        ADAPTER_IFACE, "Pairable", dbus.Boolean(False))
+        # Discovering is read-only; StopDiscovery() is the D-Bus form of `scan off`
+        self.call_bluez("Adapter1.StopDiscovery()", self.adapter.StopDiscovery)
+
+    def _on_connect_err(self) -> None:
+        self.log("Connect failed -> skipping post-connect knobs")
+
+    def write_last_mac(self, mac: str) -> None:
+        """Record the MAC in LAST_MAC_FILE; skipped when it is the one already written."""
+        if mac == self._last_written_mac:
+            return
         try:
-            cp = subprocess.run(
-                cmd,
-                check=False,
-                timeout=5,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-            out = cp.stdout or ""
-            if out.strip():
-                for line in out.strip().splitlines():
-                    self.log(f"[btctl] {line}")
-            return cp.returncode, out
-        except subprocess.TimeoutExpired:
-            self.log("[btctl] ERROR: command timed out")
-            return 124, ""
-        except Exception as e:
-            self.log(f"[btctl] ERROR: {e}")
-            return 1, ""
+            fd = os.open(LAST_MAC_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, (mac + "\n").encode("ascii"))
+            finally:
+                os.close(fd)
+            self._last_written_mac = mac
+        except OSError as e:
+            self.log(f"[MAC LOGGING ERROR] {e}")
+
+    # ---------- introspection ----------
+    @dbus.service.method("org.freedesktop.DBus.Introspectable", in_signature="", out_signature="s")
+    def Introspect(self):
+        return _AGENT_INTROSPECT_XML
 
     # ---------- org.bluez.Agent1 methods ----------
     @dbus.service.method("org.bluez.Agent1", in_signature="", out_signature="")
     def Release(self):
         self.log("Agent released")
+        self._flush_log()
 
     @dbus.service.method("org.bluez.Agent1", in_signature="os", out_signature="")
     def AuthorizeService(self, device, uuid):
@@ -156,12 +269,12 @@ class Agent(dbus.service.Object):
     def RequestConfirmation(self, device, passkey):
         """
         Auto-confirm numeric comparison pairing.
-        - Trusts and connects the device.
-        - Writes last MAC to /tmp/last_bluetooth_mac.
+        - Trusts and connects the device (async; this handler returns immediately).
+        - Writes last MAC to LAST_MAC_FILE (/tmp/last_bluetooth_mac).
         - Optionally turns off discoverable/pairable/scan on success.
         """
         self.log(f"Auto-confirming {device} with passkey {passkey}")
-        mac = self.extract_mac(device)
+        mac = extract_mac(str(device))
         self.log(f"Extracted MAC: {mac or '<none>'}")
 
         if self.dry_run:
@@ -172,26 +285,35 @@ class Agent(dbus.service.Object):
             self.log(f"[ERROR] Could not parse MAC from: {device}")
             return
 
-        self.log(f"Trusting {mac}")
-        rc_t, _ = self.run_bt("trust", mac)
+        # `device` is already the BlueZ object path; talk to it directly
+        dev = self.bus.get_object(BLUEZ, device, introspect=False)
 
-        self.log(f"Connecting {mac}")
-        rc_c, _ = self.run_bt("connect", mac)
+        props = dbus.Interface(dev, PROPS_IFACE)
 
-        # Only apply “knobs” after a successful CONNECT
-        if rc_c == 0 and self.post_connect_knobs:
-            self.log("Connect OK -> turning discoverable/pairable/scan OFF")
-            self.run_bt("discoverable", "off")
-            self.run_bt("pairable", "off")
-            self.run_bt("scan", "off")
-        elif rc_c != 0:
-            self.log("Connect failed -> skipping post-connect knobs")
+        def connect():
+            self.log(f"Connecting {mac}")
+            self.call_bluez("Device1.Connect()", dbus.Interface(dev, DEVICE_IFACE).Connect,
+                            on_ok=self._on_connect_ok, on_err=self._on_connect_err)
 
-        try:
-            with open("/tmp/last_bluetooth_mac", "w") as f:
-                f.write(mac + "\n")
-        except Exception as e:
-            self.log(f"[MAC LOGGING ERROR] {e}")
+        def on_connected_state(connected):
+            # Renegotiation on a live link: skip the multi-second Connect() roundtrip
+            if connected:
+                self.log(f"{mac} already connected -> skipping Connect()")
+                self._on_connect_ok()
+            else:
+                connect()
+
+        # BlueZ does not need Trusted before Connect: send both in the same tick so
+        # the trust bookkeeping overlaps the (much longer) connect. Only Connect's
+        # outcome drives the knob stage.
+        self.log(f"Trusting {mac}")
+        self.call_bluez("Device1.Trusted = true", props.Set,
+                        DEVICE_IFACE, "Trusted", dbus.Boolean(True))
+
+        self.call_bluez("Device1.Connected?", props.Get, DEVICE_IFACE, "Connected",
+                        on_ok=on_connected_state, on_err=connect)
+
+        self.write_last_mac(mac)
 
     @dbus.service.method("org.bluez.Agent1", in_signature="o", out_signature="")
     def RequestAuthorization(self, device):
@@ -203,68 +325,118 @@ class Agent(dbus.service.Object):
 
 
 # ---------- startup helpers ----------
-def wait_for_bluetooth_powered(log, retries: int = 10, delay: float = 1.0) -> bool:
+def wait_for_bluetooth_powered(bus, log, retries: int = 10, delay: float = 1.0) -> bool:
     """
-    Wait until `bluetoothctl show` reports 'Powered: yes'.
+    Wait until the adapter's Powered property reads true.
     This avoids registering the agent before bluetoothd is ready.
+    Event-driven: one Properties.Get, then PropertiesChanged / InterfacesAdded
+    signals on a short-lived main loop, bounded by retries * delay seconds.
     """
-    for i in range(1, retries + 1):
+    loop = GLib.MainLoop()
+    seen = []
+
+    def on_props(_iface, changed, _invalidated):
+        if changed.get("Powered"):
+            seen.append(True)
+            loop.quit()
+
+    def on_added(path, interfaces):
+        if path == ADAPTER_PATH and interfaces.get(ADAPTER_IFACE, {}).get("Powered"):
+            seen.append(True)
+            loop.quit()
+
+    # Subscribe before the Get so a power-on in between is not missed
+    matches = [
+        bus.add_signal_receiver(on_props, signal_name="PropertiesChanged", dbus_interface=PROPS_IFACE,
+                                bus_name=BLUEZ, path=ADAPTER_PATH, arg0=ADAPTER_IFACE),
+        bus.add_signal_receiver(on_added, signal_name="InterfacesAdded",
+                                dbus_interface="org.freedesktop.DBus.ObjectManager",
+                                bus_name=BLUEZ, path="/"),
+    ]
+    try:
+        adapter = bus.get_object(BLUEZ, ADAPTER_PATH, introspect=False, follow_name_owner_changes=True)
         try:
-            cp = subprocess.run(
-                ["bluetoothctl", "show"],
-                check=False,
-                timeout=5,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-            if "Powered: yes" in (cp.stdout or ""):
+            if dbus.Interface(adapter, PROPS_IFACE).Get(ADAPTER_IFACE, "Powered", timeout=BLUEZ_TIMEOUT):
                 log("Bluetooth adapter is powered: OK")
                 return True
-        except subprocess.TimeoutExpired:
-            pass
-        log(f"Adapter not powered yet (attempt {i}/{retries}) — waiting {delay:.1f}s")
-        time.sleep(delay)
-    log("WARNING: never saw Powered: yes; continuing anyway")
+        except dbus.exceptions.DBusException:
+            pass  # bluetoothd or hci0 not up yet; InterfacesAdded will tell us
+
+        budget = max(0.0, retries * delay)
+        log(f"Adapter not powered yet — waiting up to {budget:.1f}s for it")
+        # GLib timeouts run on the monotonic clock, so NTP steps or a suspend/resume
+        # cannot stretch the deadline; elapsed time is reported on the same clock.
+        start = time.monotonic()
+        timer = GLib.timeout_add(int(budget * 1000), loop.quit)
+        loop.run()
+        waited = time.monotonic() - start
+        if seen:
+            GLib.source_remove(timer)
+            log(f"Bluetooth adapter is powered: OK (after {waited:.1f}s)")
+            return True
+    finally:
+        for m in matches:
+            m.remove()
+    log(f"WARNING: never saw Powered: yes within {budget:.1f}s; continuing anyway")
     return False
 
 
 def register_agent(*, dry_run: bool = False, logfile: str | None = None, knobs: bool = True,
-                   wait_retries: int = 10, wait_delay: float = 1.0) -> Agent:
-    if not have_bluetoothctl():
-        sys.stderr.write("[startup] bluetoothctl not found in PATH\n")
-        sys.exit(1)
-
+                   wait_retries: int = 10, wait_delay: float = 1.0,
+                   loop: GLib.MainLoop | None = None) -> Agent:
+    """
+    Export the agent and register it with BlueZ. Registration is async:
+    RequestDefaultAgent is sent from RegisterAgent's reply, so BlueZ has
+    processed the registration first. On failure, `loop` (if given) is quit.
+    """
     bus = dbus.SystemBus()
     agent = Agent(bus, AGENT_PATH, dry_run=dry_run, logfile=logfile, knobs=knobs)
 
     # Wait for bluetoothd and adapter power before registering
     if not dry_run:
-        wait_for_bluetooth_powered(agent.log, retries=wait_retries, delay=wait_delay)
+        wait_for_bluetooth_powered(bus, agent.log, retries=wait_retries, delay=wait_delay)
 
     manager = dbus.Interface(
-        bus.get_object("org.bluez", "/org/bluez"),
+        bus.get_object(BLUEZ, "/org/bluez"),
         "org.bluez.AgentManager1",
     )
 
+    def on_error(e):
+        agent.log(f"[startup] ERROR: agent registration failed: {e}")
+        if loop is not None:
+            loop.quit()
+
+    def on_registered():
+        manager.RequestDefaultAgent(
+            AGENT_PATH,
+            reply_handler=lambda: agent.log("Agent registered (NoInputNoOutput) and running…"),
+            error_handler=on_error,
+        )
+
     # Use NoInputNoOutput to align with shell wrapper behavior
-    manager.RegisterAgent(AGENT_PATH, "NoInputNoOutput")
-    manager.RequestDefaultAgent(AGENT_PATH)
-    agent.log("Agent registered (NoInputNoOutput) and running…")
+    manager.RegisterAgent(AGENT_PATH, "NoInputNoOutput",
+                          reply_handler=on_registered, error_handler=on_error)
     return agent
 
 
 def main() -> None:
     args = parse_arguments()
     dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+    loop = GLib.MainLoop()
     register_agent(
         dry_run=args.dry_run,
         logfile=args.log,
         knobs=not args.no_post_connect_knobs,
         wait_retries=args.wait_retries,
         wait_delay=args.wait_delay,
+        loop=loop,
     )
-    GLib.MainLoop().run()
+    # Startup garbage (arg parsing, proxies, import-time objects) is collected once, and
+    # what survives is frozen so the idle daemon's GC passes never rescan it.
+    gc.collect()
+    gc.freeze()
+    loop.run()
+    sys.exit(1)  # only reached when registration failed (systemd restarts us)
 
 
 if __name__ == "__main__":
@@ -14,40 +14,105 @@ from http_server.export_http_server import run_server
 """
 from __future__ import annotations
 
+import email.utils
+import errno
+import fcntl
+import functools
+import html
+import io
+import ipaddress
+import mimetypes
 import os
+import re
+import select
 import socket
 import socketserver
+import stat
+import struct
 import sys
 import time
 import threading
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from urllib.parse import unquote
+from urllib.parse import quote, unquote
 
 DEFAULT_PORT = 8080
 DEFAULT_EXPORT_DIR = os.path.expanduser("~")
+SENDFILE_CHUNK = 1 << 20  # bytes per os.sendfile() call
+COPY_CHUNK = 64 * 1024     # bytes per read() when a byte range can't use sendfile
+LAN_IPS_TTL = 30           # seconds a lan_ips() answer is reused
+
+# Linux-only: hold partial frames so headers and the first body bytes share packets
+_TCP_CORK = getattr(socket, "TCP_CORK", None)
+
+# Linux ioctl: read an interface's IPv4 address (struct ifreq, addr at [20:24])
+_SIOCGIFADDR = 0x8915
+
+# Single byte-range spec: "bytes=a-b", "bytes=a-" or suffix "bytes=-n"
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _set_cork(sock, on: bool) -> None:
+    """Toggle TCP_CORK where the platform has it (no-op elsewhere)."""
+    if _TCP_CORK is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, int(on))
+    except OSError:
+        pass
 
 
 def lan_ips():
-    """Discover a few useful LAN address hints (mDNS + LAN IPs)."""
+    """Discover a few useful LAN address hints (mDNS + LAN IPs).
+
+    Cached for LAN_IPS_TTL seconds; addresses rarely change while the server runs.
+    """
+    bucket = int(time.monotonic() // LAN_IPS_TTL)
+    hit = _LAN_IPS_CACHE.get(bucket)
+    if hit is None:
+        hit = _discover_lan_ips()
+        _LAN_IPS_CACHE.clear()  # keep only the current TTL bucket
+        _LAN_IPS_CACHE[bucket] = hit
+    return list(hit)
+
+
+# TTL bucket -> last lan_ips() answer (at most one entry)
+_LAN_IPS_CACHE: dict[int, tuple[tuple[str, str], ...]] = {}
+
+
+def _clear_lan_ips_cache() -> None:
+    """Forget the cached lan_ips() answer (next call rediscovers)."""
+    _LAN_IPS_CACHE.clear()
+
+
+def _discover_lan_ips() -> tuple[tuple[str, str], ...]:
     names = []
     try:
         names.append(("mDNS", f"{socket.gethostname()}.local"))
     except Exception:
         pass
-    # cheap LAN IP discovery (no packet actually sent)
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        names.append(("LAN", s.getsockname()[0]))
-        s.close()
-    except Exception:
-        pass
-    # hostname -I
+    # interface addresses straight from the kernel; UDP-connect trick elsewhere
+    # (no packet actually sent)
+    ifaces = _iface_ipv4s() if sys.platform.startswith("linux") else []
+    if ifaces:
+        names.extend(("LAN", ip) for ip in ifaces)
+    else:
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.connect(("8.8.8.8", 80))
+            names.append(("LAN", s.getsockname()[0]))
+            s.close()
+        except Exception:
+            pass
+    # addresses the resolver knows for this host (no hostname -I fork)
     try:
-        addrs = os.popen("hostname -I").read().strip().split()
-        for a in addrs:
-            names.append(("LAN", a))
+        for *_, sockaddr in socket.getaddrinfo(socket.gethostname(), None, proto=socket.IPPROTO_TCP):
+            addr = sockaddr[0]
+            ip = ipaddress.ip_address(addr.split("%", 1)[0])
+            if not (ip.is_loopback or ip.is_link_local):
+                names.append(("LAN", addr))
     except Exception:
         pass
     # dedupe, preserve order
@@ -56,7 +121,65 @@ def lan_ips():
         if v and v not in seen:
             seen.add(v)
             uniq.append((k, v))
-    return uniq or [("loopback", "127.0.0.1")]
+    return tuple(uniq) or (("loopback", "127.0.0.1"),)
+
+
+def _iface_ipv4s() -> list[str]:
+    """IPv4 of each non-loopback interface via SIOCGIFADDR (Linux); [] on failure."""
+    ips = []
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            for _idx, name in socket.if_nameindex():
+                if name == "lo":
+                    continue
+                try:
+                    ifreq = fcntl.ioctl(s.fileno(), _SIOCGIFADDR,
+                                        struct.pack("256s", name[:15].encode()))
+                except OSError:
+                    continue  # interface is down or has no IPv4
+                ip = socket.inet_ntoa(ifreq[20:24])
+                if not ipaddress.ip_address(ip).is_link_local:
+                    ips.append(ip)
+        finally:
+            s.close()
+    except Exception:
+        return []
+    return ips
+
+
+
+@functools.lru_cache(maxsize=256)
+def _ctype_for(ext: str) -> str:
+    """Content-Type for a file extension, by the stdlib handler's rules, memoized per ext."""
+    ext_map = SimpleHTTPRequestHandler.extensions_map
+    return (
+        ext_map.get(ext)
+        or ext_map.get(ext.lower())
+        or mimetypes.guess_type("f" + ext)[0]
+        or "application/octet-stream"
+    )
+
+
+class _FileWindow:
+    """Body of a single-file response: `length` bytes of `fd` starting at `offset`.
+
+    `fd` is the request's own dup of the shared descriptor. Reads go through
+    explicit offsets (sendfile/pread), never the file position that dups share,
+    so concurrent requests can't race.
+    """
+    __slots__ = ("fd", "offset", "length")
+
+    def __init__(self, fd: int, offset: int = 0, length: int = 0):
+        self.fd, self.offset, self.length = fd, offset, length
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            fd, self.fd = self.fd, -1
+            os.close(fd)
 
 
 class DownloadOnlyHandler(SimpleHTTPRequestHandler):
@@ -64,37 +187,170 @@ class DownloadOnlyHandler(SimpleHTTPRequestHandler):
     Read-only HTTP handler that:
       - In single-file mode (serve_single_file set), serves that file for ANY request.
       - Optionally allows directory listing when allow_dir_list is True.
-      - Sets Content-Disposition: attachment and Cache-Control: no-store for file responses.
+      - Sets Content-Disposition: attachment and Cache-Control: no-cache for file responses,
+        with ETag/Last-Modified so repeat downloads revalidate to a bodiless 304.
     """
     serve_single_file: str | None = None
     allow_dir_list: bool = False
     base_dir: str | None = None
 
+    # Persistent connections: every response path sends Content-Length (or is a
+    # bodiless 304 / a send_error that closes). An idle keep-alive still holds a
+    # pool worker, so it only gets `keepalive_timeout` seconds to send its next
+    # request, and none at all while the pool is saturated. `timeout` bounds a
+    # stalled request or transfer.
+    protocol_version = "HTTP/1.1"
+    timeout = 15
+    keepalive_timeout = 2
+    # Buffered wfile: headers plus small bodies (listings, error pages) leave in one
+    # write; the stdlib flushes after every request. File bodies bypass it (sendfile)
+    wbufsize = -1
+
+    # Single-file facts resolved once per configured subclass (see __init_subclass__)
+    _resolved_path: str | None = None
+    _basename: str = ""
+    _ctype: str = "application/octet-stream"
+    _static_headers: bytes = b""  # pre-encoded constant header lines for file responses
+    _shared_fd: int | None = None  # the single file, kept open (see _open_single_file)
+    _shared_ident: tuple[int, int] | None = None  # (st_dev, st_ino) behind _shared_fd
+    _shared_lock: threading.Lock | None = None
+    _declared_length: int | None = None  # Content-Length sent for this response
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.serve_single_file:
+            # A relative name is relative to base_dir (absolute paths pass through)
+            cls._resolved_path = os.path.abspath(
+                os.path.join(cls.base_dir or "", cls.serve_single_file)
+            )
+            cls._basename = os.path.basename(cls._resolved_path)
+            cls._ctype = _ctype_for(os.path.splitext(cls._resolved_path)[1])
+            # Headers that never change for this file, encoded once; a name outside
+            # latin-1 degrades to '?' instead of failing every request in send_header
+            cls._static_headers = (
+                f"Content-Type: {cls._ctype}\r\n"
+                f'Content-Disposition: attachment; filename="{cls._basename}"\r\n'
+                "Cache-Control: no-cache\r\n"
+                "Accept-Ranges: bytes\r\n"
+            ).encode("latin-1", "replace")
+            # Opened lazily by the first request, then reused while the path
+            # still names the same file
+            cls._shared_fd = cls._shared_ident = None
+            cls._shared_lock = threading.Lock()
+
+    @classmethod
+    def close_shared_fd(cls) -> None:
+        """Release the kept-open single file (call when the server stops)."""
+        fd, cls._shared_fd, cls._shared_ident = cls._shared_fd, None, None
+        if fd is not None:
+            os.close(fd)
+
+    def _open_single_file(self) -> tuple[_FileWindow, os.stat_result] | None:
+        """Dup the shared fd for this request, reopening it if the file was replaced.
+
+        An atomic save (write temp + rename) puts a new inode at the path; a stat
+        of the path per request notices that and swaps the shared fd. Returns
+        None if the file can't be opened.
+        """
+        cls = type(self)
+        try:
+            st = os.stat(cls._resolved_path)
+        except OSError:
+            return None
+        with cls._shared_lock:
+            if cls._shared_ident != (st.st_dev, st.st_ino):
+                try:
+                    fd = os.open(cls._resolved_path, os.O_RDONLY)
+                except OSError:
+                    return None
+                st = os.fstat(fd)  # describe exactly what was opened
+                old, cls._shared_fd = cls._shared_fd, fd
+                cls._shared_ident = (st.st_dev, st.st_ino)
+                if old is not None:
+                    os.close(old)  # in-flight requests hold their own dups
+            return _FileWindow(os.dup(cls._shared_fd)), st
+
+    def handle_one_request(self):
+        super().handle_one_request()
+        if self.close_connection:
+            return
+        saturated = getattr(self.server, "saturated", None)
+        if saturated is not None and saturated():
+            self.close_connection = True  # hand the worker to a waiting client
+        else:
+            self.connection.settimeout(self.keepalive_timeout)
+
+    def parse_request(self):
+        # A request line arrived: back to the full timeout for this request
+        self.connection.settimeout(self.timeout)
+        return super().parse_request()
+
+    def __init__(self, *args, **kwargs):
+        # Resolve against base_dir via the stdlib's `directory` (no process-wide chdir)
+        kwargs.setdefault("directory", self.base_dir)
+        super().__init__(*args, **kwargs)
+
+    def guess_type(self, path) -> str:
+        return _ctype_for(os.path.splitext(path)[1])
+
     def translate_path(self, path: str) -> str:
         """Resolve request path to a filesystem path.
 
         If serve_single_file is set, always return that file's absolute path.
-        Otherwise resolve relative to base_dir (if set) or cwd.
+        Otherwise the stdlib resolves it under self.directory (base_dir, or cwd).
         """
         # Always serve the configured single file (if any)
-        serve = getattr(self, "serve_single_file", None)
-        if serve:
-            return os.path.abspath(serve)
-
-        # Normal resolution relative to base_dir
-        path = unquote(path)
-        if path.startswith("/"):
-            path = path[1:]
-        base = getattr(self, "base_dir", None) or os.getcwd()
-        full_path = os.path.abspath(os.path.join(base, path))
-        return full_path
+        if self._resolved_path:
+            return self._resolved_path
+        return super().translate_path(path)
 
     def list_directory(self, path):
         """Allow directory listing only when allowed."""
-        if not bool(getattr(self, "allow_dir_list", False)):
+        if not self.allow_dir_list:
             self.send_error(403, "Directory listing disabled")
             return None
-        return super().list_directory(path)
+        # Same page as the stdlib, but built from one scandir() pass: DirEntry
+        # answers is_dir/is_symlink from readdir's d_type instead of two stats per name
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(
+                    ((e.name, e.is_dir(), e.is_symlink()) for e in it),
+                    key=lambda t: t[0].lower(),
+                )
+        except OSError:
+            self.send_error(404, "No permission to list directory")
+            return None
+        try:
+            displaypath = unquote(self.path, errors="surrogatepass")
+        except UnicodeDecodeError:
+            displaypath = unquote(self.path)
+        displaypath = html.escape(displaypath, quote=False)
+        enc = sys.getfilesystemencoding()
+        title = f"Directory listing for {displaypath}"
+        r = [
+            "<!DOCTYPE HTML>",
+            '<html lang="en">',
+            "<head>",
+            f'<meta charset="{enc}">',
+            f"<title>{title}</title>\n</head>",
+            f"<body>\n<h1>{title}</h1>",
+            "<hr>\n<ul>",
+        ]
+        for name, is_dir, is_link in entries:
+            # Append / for directories or @ for symbolic links
+            # (a link to a directory displays with @ and links with /)
+            linkname = name + "/" if is_dir else name
+            displayname = name + "@" if is_link else linkname
+            r.append('<li><a href="%s">%s</a></li>'
+                     % (quote(linkname, errors="surrogatepass"),
+                        html.escape(displayname, quote=False)))
+        r.append("</ul>\n<hr>\n</body>\n</html>\n")
+        encoded = "\n".join(r).encode(enc, "surrogateescape")
+        self.send_response(200)
+        self.send_header("Content-type", f"text/html; charset={enc}")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        return io.BytesIO(encoded)
 
     def send_head(self):
         """Send headers and return file object for GET/HEAD.
@@ -102,39 +358,292 @@ class DownloadOnlyHandler(SimpleHTTPRequestHandler):
         If serve_single_file is set, this sends the file with attachment headers.
         Otherwise fall back to SimpleHTTPRequestHandler.send_head().
         """
-        serve = getattr(self, "serve_single_file", None)
+        self._declared_length = None
+        serve = self.serve_single_file
         if serve:
-            # Resolve using translate_path to support absolute/relative config
-            path = self.translate_path(self.path)
-            if os.path.exists(path) and os.path.isfile(path):
-                try:
-                    f = open(path, "rb")
-                except OSError:
-                    self.send_error(404, "File not found")
-                    return None
-                self.send_response(200)
-                ctype = self.guess_type(path) or "application/octet-stream"
-                self.send_header("Content-Type", ctype)
-                self.send_header("Content-Length", str(os.path.getsize(path)))
-                self.send_header(
-                    "Content-Disposition",
-                    f'attachment; filename="{os.path.basename(path)}"',
-                )
-                self.send_header("Cache-Control", "no-store")
-                self.end_headers()
-                return f
-            else:
+            # Path/name/type were resolved once at class setup and the file stays
+            # open; per request there is a stat of the path and a dup
+            opened = self._open_single_file()
+            if opened is None:
                 self.send_error(404, "File not found")
                 return None
+            body, st = opened
+            if not stat.S_ISREG(st.st_mode):
+                body.close()
+                self.send_error(404, "File not found")
+                return None
+            etag = f'"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"'
+            lastmod = self.date_time_string(st.st_mtime)
+            if self._not_modified(etag, st.st_mtime):
+                body.close()
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return None
+
+            size = st.st_size
+            rng = self._byte_range(size, etag, lastmod)
+            if rng is not None and rng[0] > rng[1]:
+                body.close()
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+            if rng is None:
+                code = 200
+                body.length = size
+                varying = f"Content-Length: {size}\r\n"
+            else:
+                code = 206
+                start, end = rng
+                body.offset, body.length = start, end - start + 1
+                varying = (
+                    f"Content-Range: bytes {start}-{end}/{size}\r\n"
+                    f"Content-Length: {body.length}\r\n"
+                )
+            self._write_head(code, f"{varying}ETag: {etag}\r\nLast-Modified: {lastmod}\r\n")
+            return body
         # Default behavior
         return super().send_head()
 
+    def _write_head(self, code: int, varying: str) -> None:
+        """Write status line + headers for a file response in one wfile.write().
+
+        Same lines send_response() would add (Server, Date), then the per-request
+        `varying` lines and the class's pre-encoded _static_headers.
+        """
+        self.log_request(code)
+        if self.request_version == "HTTP/0.9":
+            return  # 0.9 responses have no head
+        self.wfile.write(
+            (
+                f"{self.protocol_version} {code} {self.responses[code][0]}\r\n"
+                f"Server: {self.version_string()}\r\n"
+                f"Date: {self.date_time_string()}\r\n"
+                f"{varying}"
+            ).encode("latin-1")
+            + self._static_headers
+            + b"\r\n"
+        )
+
+    def send_header(self, keyword, value):
+        # Remember the declared body length so copyfile never sends past it
+        if keyword.lower() == "content-length":
+            self._declared_length = int(value)
+        super().send_header(keyword, value)
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        """True if the request's validators show the client already has this version.
+
+        If-None-Match wins over If-Modified-Since when both are sent (RFC 9110).
+        """
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            tags = {t.strip() for t in inm.split(",")}
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        ims = self.headers.get("If-Modified-Since")
+        if ims:
+            try:
+                since = email.utils.parsedate_to_datetime(ims)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return int(mtime) <= since.timestamp()
+        return False
+
+    def _byte_range(self, size: int, etag: str, lastmod: str) -> tuple[int, int] | None:
+        """Parse a single-range `Range: bytes=...` header against size.
+
+        Returns None to send the whole file (no Range, a form we don't serve such
+        as multi-range, or an If-Range that no longer matches), else an inclusive
+        (start, end). start > end means the range is unsatisfiable (416).
+        """
+        hdr = self.headers.get("Range")
+        if not hdr:
+            return None
+        m = _RANGE_RE.match(hdr.strip())
+        if not m or not (m.group(1) or m.group(2)):
+            return None
+        if_range = self.headers.get("If-Range")
+        if if_range and if_range.strip() not in (etag, lastmod):
+            return None
+        first, last = m.groups()
+        if first:
+            start = int(first)
+            if last and int(last) < start:
+                return None  # invalid spec: ignore the header
+            end = min(int(last), size - 1) if last else size - 1
+            return (start, end) if start < size else (size, size - 1)
+        # suffix form: the final n bytes
+        n = int(last)
+        if n == 0:
+            return size, size - 1
+        return max(0, size - n), size - 1
+
+    def copyfile(self, source, outputfile):
+        """Copy the body with os.sendfile (kernel-side, no userspace buffer).
+
+        A _FileWindow (single-file mode) is sent exactly; other files are sent
+        from their current position up to the declared Content-Length, so a file
+        growing mid-transfer can't spill into the next keep-alive response.
+        Falls back to userspace copies when
+        either side has no real fd (e.g. the BytesIO of a directory listing) or
+        sendfile is unsupported. If the file turns out shorter than declared
+        (truncated mid-transfer), the connection is closed so the client sees
+        the body end early instead of waiting for bytes that never come.
+        """
+        window = isinstance(source, _FileWindow)
+        if window:
+            offset, remaining = source.offset, source.length
+        else:
+            try:
+                source.fileno()
+            except (AttributeError, OSError):
+                return super().copyfile(source, outputfile)
+            offset, remaining = source.tell(), self._declared_length
+
+        short = self._sendfile(source.fileno(), outputfile, offset, remaining)
+        if short is not None:
+            if short:
+                self.close_connection = True
+            return
+        # sendfile unavailable for this fd pair; nothing has been sent yet
+        if remaining is None:
+            source.seek(offset)
+            return super().copyfile(source, outputfile)
+        while remaining > 0:
+            buf = os.pread(source.fileno(), min(COPY_CHUNK, remaining), offset)
+            if not buf:
+                break
+            outputfile.write(buf)
+            offset += len(buf)
+            remaining -= len(buf)
+        if remaining > 0:
+            self.close_connection = True
+
+    def _sendfile(self, in_fd: int, outputfile, offset: int, remaining: int | None) -> int | None:
+        """sendfile() from in_fd at offset (remaining bytes, or to EOF if None).
+
+        Returns how many of the `remaining` bytes could not be sent because the
+        file hit EOF early (0 when complete, always 0 for None), or None if
+        sendfile can't be used here (before any byte went out), so the caller
+        can fall back.
+        """
+        if not hasattr(os, "sendfile") or outputfile is not self.wfile:
+            return None
+        outputfile.flush()  # buffered headers must hit the socket before the body
+        out_fd = self.connection.fileno()
+        start = offset
+        while remaining is None or remaining > 0:
+            count = SENDFILE_CHUNK if remaining is None else min(SENDFILE_CHUNK, remaining)
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset, count)
+            except BlockingIOError:
+                # socket has a timeout (non-blocking underneath): wait for send room
+                if not select.select([], [out_fd], [], self.timeout)[1]:
+                    raise TimeoutError("sendfile: client stopped reading") from None
+                continue
+            except OSError:
+                if offset != start:
+                    raise
+                return None  # sendfile refused this fd pair
+            if sent == 0:
+                break  # EOF: the file is shorter than it was when stat'ed
+            offset += sent
+            if remaining is not None:
+                remaining -= sent
+        return remaining or 0
+
     def do_GET(self):
         # Quiet favicon requests
         if self.path == "/favicon.ico":
             self.send_error(404, "Not found")
             return
-        super().do_GET()
+        # Cork the whole response; uncorking flushes the tail at once (no Nagle wait)
+        _set_cork(self.connection, True)
+        try:
+            super().do_GET()
+        finally:
+            _set_cork(self.connection, False)
+
+
+class _WorkerPool:
+    """Bounded thread pool that also counts the connections it holds (running or queued).
+
+    One instance can be shared by several listeners so they split one worker budget.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="silo-http")
+        self._lock = threading.Lock()
+        self._held = 0
+
+    def submit(self, fn, *args) -> None:
+        with self._lock:
+            self._held += 1
+        self._executor.submit(self._run, fn, args)
+
+    def _run(self, fn, args) -> None:
+        try:
+            fn(*args)
+        finally:
+            with self._lock:
+                self._held -= 1
+
+    def saturated(self) -> bool:
+        """True when every worker is taken, so a new connection would have to queue."""
+        return self._held >= self.max_workers
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that hands connections to a bounded pool of reused threads.
+
+    Caps concurrent handlers (a burst or port scan can't spawn unbounded threads)
+    and skips a thread start per connection. Excess connections queue in the pool;
+    handlers stop keeping connections alive while it is saturated. Pass `pool` to
+    share one _WorkerPool between listeners (the caller then shuts it down).
+    """
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    request_queue_size = 64  # listen() backlog for keep-alive bursts (stdlib default: 5)
+    reuse_port = False  # SO_REUSEPORT: let several listeners share the port (Linux 3.9+)
+
+    def __init__(self, *args, pool: _WorkerPool | None = None, reuse_port: bool | None = None, **kwargs):
+        if reuse_port is not None:
+            self.reuse_port = reuse_port
+        super().__init__(*args, **kwargs)
+        self._owns_pool = pool is None
+        self._pool = pool if pool is not None else _WorkerPool(self.max_workers)
+
+    def server_bind(self):
+        if self.reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def get_request(self):
+        sock, addr = super().get_request()
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        return sock, addr
+
+    def process_request(self, request, client_address):
+        # process_request_thread already wraps finish_request/handle_error/shutdown_request
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def saturated(self) -> bool:
+        return self._pool.saturated()
+
+    def server_close(self):
+        super().server_close()
+        if self._owns_pool:
+            self._pool.shutdown()
 
 
 @contextlib.contextmanager
@@ -146,27 +655,42 @@ def run_server(export_dir: str, serve_file: str | None = None, allow_list: bool
         with run_server(export_dir, serve_file=..., allow_list=True) as (host, port):
             ...
     """
-    prev_cwd = os.getcwd()
-    os.chdir(export_dir)
-
     class Handler(DownloadOnlyHandler):
         base_dir = export_dir
         serve_single_file = serve_file
         allow_dir_list = bool(allow_list)
 
-    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd = PooledHTTPServer(("127.0.0.1", 0), Handler)
 
     th = threading.Thread(target=httpd.serve_forever, daemon=True)
     th.start()
     try:
-        # tiny pause to ensure it's listening on some systems
-        time.sleep(0.05)
+        # No readiness wait: the constructor already bound and listen()ed, so
+        # connections queue in the backlog until serve_forever picks them up
         host, port = httpd.server_address
         yield host, port
     finally:
         httpd.shutdown()
         httpd.server_close()
-        os.chdir(prev_cwd)
+        Handler.close_shared_fd()
+
+
+def _port_taken(host: str, port: int) -> bool:
+    """True if another socket already listens on (host, port).
+
+    Probed with a plain bind (SO_REUSEADDR like the server, no SO_REUSEPORT):
+    a reuseport group would otherwise silently share the port with any other
+    reuseport listener of the same user, e.g. a second export server.
+    """
+    if port == 0:
+        return False
+    with socket.socket(PooledHTTPServer.address_family, socket.SOCK_STREAM) as probe:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            probe.bind((host, port))
+        except OSError as e:
+            return e.errno == errno.EADDRINUSE
+    return False
 
 
 # Optional CLI entrypoint — kept minimal and non-blocking for tests that import module.
@@ -194,18 +718,41 @@ def main(argv=None):
             sys.exit(1)
 
     print(f"Serving {serve_file or export_dir} on {args.bind}:{args.port}")
-    os.chdir(export_dir)
 
     class Handler(DownloadOnlyHandler):
         base_dir = export_dir
         serve_single_file = serve_file
         allow_dir_list = bool(args.list)
 
-    with ThreadingHTTPServer((args.bind, args.port), Handler) as httpd:
-        try:
-            httpd.serve_forever()
-        except KeyboardInterrupt:
-            pass
+    # One listener per core on the same port; the kernel spreads incoming
+    # connections across their accept queues. All listeners share one worker pool.
+    n = (os.cpu_count() or 1) if hasattr(socket, "SO_REUSEPORT") else 1
+    if n > 1 and _port_taken(args.bind, args.port):
+        print(f"Address already in use: {args.bind}:{args.port}", file=sys.stderr)
+        sys.exit(1)
+    pool = _WorkerPool(PooledHTTPServer.max_workers)
+    servers = [PooledHTTPServer((args.bind, args.port), Handler,
+                                pool=pool, reuse_port=n > 1)]
+    port = servers[0].server_address[1]
+    try:
+        for _ in range(n - 1):
+            servers.append(PooledHTTPServer((args.bind, port), Handler,
+                                            pool=pool, reuse_port=True))
+    except OSError:
+        pass  # keep the listeners we got
+    for extra in servers[1:]:
+        threading.Thread(target=extra.serve_forever, daemon=True).start()
+    try:
+        servers[0].serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for extra in servers[1:]:
+            extra.shutdown()
+        for httpd in servers:
+            httpd.server_close()
+        pool.shutdown()
+        Handler.close_shared_fd()
 
 
 if __name__ == "__main__":
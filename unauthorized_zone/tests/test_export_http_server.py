@@ -7,12 +7,13 @@ import pytest
 
 # import the run_server and lan_ips from the drop-in module
 from http_server.export_http_server import run_server as _run_server
-from http_server.export_http_server import lan_ips
+from http_server.export_http_server import lan_ips, _clear_lan_ips_cache
+from http_server.export_http_server import PooledHTTPServer, DownloadOnlyHandler
 
 
-def _http_get(host, port, path="/"):
+def _http_get(host, port, path="/", headers=None):
     conn = http.client.HTTPConnection(host, port, timeout=3)
-    conn.request("GET", path)
+    conn.request("GET", path, headers=headers or {})
     resp = conn.getresponse()
     body = resp.read()
     conn.close()
@@ -36,11 +37,208 @@ def test_single_file_download_headers_and_body(tmp_path):
         cd = resp.getheader("Content-Disposition", "")
         assert "attachment;" in cd
         assert 'filename="parcel.txt"' in cd
-        assert resp.getheader("Cache-Control") == "no-store"
+        assert resp.getheader("Cache-Control") == "no-cache"
+        assert resp.getheader("ETag")
+        assert resp.getheader("Last-Modified")
+        assert resp.getheader("Accept-Ranges") == "bytes"
         # Content-Type guessed by SimpleHTTPRequestHandler
         assert resp.getheader("Content-Type") in ("text/plain", "text/plain; charset=utf-8")
 
 
+def test_single_file_relative_name_resolves_in_export_dir(tmp_path):
+    export_dir = tmp_path
+    (export_dir / "parcel.txt").write_bytes(b"relative\n")
+
+    with _run_server(
+        export_dir=str(export_dir),
+        serve_file="parcel.txt",
+        allow_list=False,
+    ) as (host, port):
+        resp, body = _http_get(host, port)
+        assert resp.status == 200
+        assert body == b"relative\n"
+
+
+def test_single_file_large_body_is_complete(tmp_path):
+    export_dir = tmp_path
+    target = export_dir / "big.bin"
+    content = os.urandom(3 * (1 << 20) + 123)  # spans several sendfile chunks
+    target.write_bytes(content)
+
+    with _run_server(
+        export_dir=str(export_dir),
+        serve_file=str(target),
+        allow_list=False,
+    ) as (host, port):
+        resp, body = _http_get(host, port, "/")
+        assert resp.status == 200
+        assert int(resp.getheader("Content-Length")) == len(content)
+        assert body == content
+
+
+def test_single_file_conditional_get_returns_304(tmp_path):
+    export_dir = tmp_path
+    target = export_dir / "parcel.txt"
+    target.write_bytes(b"hello-world\n")
+
+    with _run_server(
+        export_dir=str(export_dir),
+        serve_file=str(target),
+        allow_list=False,
+    ) as (host, port):
+        first, _ = _http_get(host, port, "/")
+        etag = first.getheader("ETag")
+        lastmod = first.getheader("Last-Modified")
+
+        resp, body = _http_get(host, port, "/", {"If-None-Match": etag})
+        assert resp.status == 304
+        assert body == b""
+        assert resp.getheader("ETag") == etag
+
+        resp, body = _http_get(host, port, "/", {"If-Modified-Since": lastmod})
+        assert resp.status == 304
+        assert body == b""
+
+        resp, _ = _http_get(host, port, "/", {"If-None-Match": '"stale"'})
+        assert resp.status == 200
+
+
+def test_single_file_follows_atomic_replace(tmp_path):
+    export_dir = tmp_path
+    target = export_dir / "parcel.txt"
+    target.write_bytes(b"old draft\n")
+
+    with _run_server(
+        export_dir=str(export_dir),
+        serve_file=str(target),
+        allow_list=False,
+    ) as (host, port):
+        resp, body = _http_get(host, port)
+        assert body == b"old draft\n"
+        old_etag = resp.getheader("ETag")
+
+        # Editor-style save: write a temp file, rename it over the original
+        tmp = export_dir / "parcel.txt.swp"
+        tmp.write_bytes(b"new draft, longer\n")
+        os.replace(tmp, target)
+
+        resp, body = _http_get(host, port)
+        assert resp.status == 200
+        assert body == b"new draft, longer\n"
+        assert resp.getheader("ETag") != old_etag
+
+
+def test_single_file_range_requests(tmp_path):
+    export_dir = tmp_path
+    target = export_dir / "parcel.bin"
+    content = bytes(range(256)) * 4
+    target.write_bytes(content)
+
+    with _run_server(
+        export_dir=str(export_dir),
+        serve_file=str(target),
+        allow_list=False,
+    ) as (host, port):
+        resp, body = _http_get(host, port, "/", {"Range": "bytes=10-19"})
+        assert resp.status == 206
+        assert body == content[10:20]
+        assert resp.getheader("Content-Range") == f"bytes 10-19/{len(content)}"
+
+        resp, body = _http_get(host, port, "/", {"Range": "bytes=-5"})
+        assert resp.status == 206
+        assert body == content[-5:]
+
+        resp, body = _http_get(host, port, "/", {"Range": "bytes=1000-"})
+        assert resp.status == 206
+        assert body == content[1000:]
+
+        resp, _ = _http_get(host, port, "/", {"Range": f"bytes={len(content)}-"})
+        assert resp.status == 416
+        assert resp.getheader("Content-Range") == f"bytes */{len(content)}"
+
+        resp, body = _http_get(host, port, "/", {"Range": "bytes=0-1", "If-Range": '"stale"'})
+        assert resp.status == 200
+        assert body == content
+
+
+def test_single_file_keep_alive_reuses_connection(tmp_path):
+    export_dir = tmp_path
+    target = export_dir / "parcel.txt"
+    content = b"hello-world\n"
+    target.write_bytes(content)
+
+    with _run_server(
+        export_dir=str(export_dir),
+        serve_file=str(target),
+        allow_list=False,
+    ) as (host, port):
+        conn = http.client.HTTPConnection(host, port, timeout=3)
+        try:
+            for _ in range(3):
+                conn.request("GET", "/")
+                resp = conn.getresponse()
+                assert resp.status == 200
+                assert resp.read() == content
+                assert not resp.will_close
+        finally:
+            conn.close()
+
+
+def test_idle_keep_alives_do_not_starve_new_clients(tmp_path, monkeypatch):
+    monkeypatch.setattr(PooledHTTPServer, "max_workers", 2)
+    target = tmp_path / "parcel.txt"
+    target.write_bytes(b"x")
+
+    with _run_server(
+        export_dir=str(tmp_path),
+        serve_file=str(target),
+        allow_list=False,
+    ) as (host, port):
+        # Occupy every worker with a connection that goes idle after one request
+        idle = [http.client.HTTPConnection(host, port, timeout=3) for _ in range(2)]
+        try:
+            for conn in idle:
+                conn.request("GET", "/")
+                conn.getresponse().read()
+            start = time.monotonic()
+            resp, body = _http_get(host, port)
+            assert resp.status == 200 and body == b"x"
+            assert time.monotonic() - start < 1.0
+        finally:
+            for conn in idle:
+                conn.close()
+
+
+def test_truncated_body_closes_connection(tmp_path, monkeypatch):
+    target = tmp_path / "parcel.bin"
+    target.write_bytes(b"x" * 100_000)
+
+    # Shrink the file after the headers promised 100 000 bytes
+    send_head = DownloadOnlyHandler.send_head
+    def _send_head_then_truncate(self):
+        body = send_head(self)
+        os.truncate(target, 1000)
+        return body
+    monkeypatch.setattr(DownloadOnlyHandler, "send_head", _send_head_then_truncate)
+
+    with _run_server(
+        export_dir=str(tmp_path),
+        serve_file=str(target),
+        allow_list=False,
+    ) as (host, port):
+        conn = http.client.HTTPConnection(host, port, timeout=3)
+        try:
+            conn.request("GET", "/")
+            resp = conn.getresponse()
+            start = time.monotonic()
+            with pytest.raises(http.client.IncompleteRead):
+                resp.read()
+            # The server closed right away, not after the keep-alive idle timeout
+            assert time.monotonic() - start < 1.0
+        finally:
+            conn.close()
+
+
 def test_directory_listing_disabled_returns_403(tmp_path):
     export_dir = tmp_path
     (export_dir / "sub").mkdir()
@@ -127,14 +325,21 @@ def test_lan_ips_dedup_and_order(monkeypatch):
 
     monkeypatch.setattr(socket, "socket", lambda *a, **k: _FakeSock())
 
-    class _FakePopenOut:
-        def read(self):
-            return "192.168.0.123 10.0.0.5"
+    def _fake_getaddrinfo(*args, **kwargs):
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.168.0.123", 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.5", 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.1.1", 0)),
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("fe80::1%eth0", 0, 0, 2)),
+        ]
 
-    monkeypatch.setattr(os, "popen", lambda cmd: _FakePopenOut())
+    monkeypatch.setattr(socket, "getaddrinfo", _fake_getaddrinfo)
 
+    _clear_lan_ips_cache()
     ips = lan_ips()
     assert ips[0] == ("mDNS", "raspberrypi.local")
     assert ("LAN", "192.168.0.123") in ips
     assert ("LAN", "10.0.0.5") in ips
+    assert ("LAN", "127.0.1.1") not in ips
+    assert all(not v.startswith("fe80:") for _, v in ips)
     assert len({v for _, v in ips}) == len(ips)